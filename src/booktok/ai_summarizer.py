@@ -10,6 +10,11 @@ from booktok.config import OpenRouterConfig
 
 logger = logging.getLogger(__name__)
 
+OPENROUTER_CHAT_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Idle pooled connections are kept open this long for reuse
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
 
 class AISummarizer:
     """Handles interaction with OpenRouter AI for text summarization."""
@@ -21,6 +26,33 @@ class AISummarizer:
             config: OpenRouter configuration.
         """
         self.config = config
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        The client is created lazily so it binds to the running event
+        loop. Its pool keeps a kept-alive connection per concurrent summary
+        request, so repeated requests skip the TCP and TLS handshake.
+
+        Returns:
+            The shared async HTTP client.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(1, self.config.summary_concurrency),
+                    keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def summarize_snippets(
         self,
@@ -50,33 +82,31 @@ class AISummarizer:
         prompt = self._build_prompt(current_snippets, previous_snippet)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.config.api_key}",
-                        "HTTP-Referer": self.config.site_url,
-                        "X-Title": self.config.app_name,
-                    },
-                    json={
-                        "model": self.config.model,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            }
-                        ],
-                    },
-                    timeout=60.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if "choices" in data and len(data["choices"]) > 0:
-                    return data["choices"][0]["message"]["content"]
-
-                logger.error(f"Unexpected API response: {data}")
-                return "Error: Could not generate summary (unexpected response format)."
+            response = await self._get_client().post(
+                OPENROUTER_CHAT_URL,
+                headers={
+                    "Authorization": f"Bearer {self.config.api_key}",
+                    "HTTP-Referer": self.config.site_url,
+                    "X-Title": self.config.app_name,
+                },
+                json={
+                    "model": self.config.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        }
+                    ],
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "choices" in data and len(data["choices"]) > 0:
+                return data["choices"][0]["message"]["content"]
+
+            logger.error(f"Unexpected API response: {data}")
+            return "Error: Could not generate summary (unexpected response format)."
 
         except httpx.HTTPError as e:
             logger.error(f"OpenRouter API error: {e}")
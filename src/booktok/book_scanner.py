@@ -1,7 +1,9 @@
 """Book scanner module for discovering books in a directory."""
 
 import logging
+import time
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,6 +13,22 @@ from booktok.models import FileType
 logger = logging.getLogger(__name__)
 
 
+def format_size(size_bytes: float) -> str:
+    """Format file size in human-readable format.
+
+    Args:
+        size_bytes: Size in bytes.
+
+    Returns:
+        Human-readable size string (e.g., "1.5 MB").
+    """
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} TB"
+
+
 @dataclass
 class BookFile:
     """Represents a book file found in the books directory."""
@@ -29,6 +47,24 @@ class BookFile:
         """
         return self.path.stem
 
+    @cached_property
+    def size_str(self) -> str:
+        """Get the file size in human-readable format.
+
+        Returns:
+            Size string such as "1.5 MB".
+        """
+        return format_size(self.size_bytes)
+
+    @cached_property
+    def file_type_label(self) -> str:
+        """Get the file type as shown to users.
+
+        Returns:
+            Upper-case file type such as "PDF".
+        """
+        return self.file_type.value.upper()
+
 
 class BookScanner:
     """Scanner for discovering book files in a directory."""
@@ -39,6 +75,9 @@ class BookScanner:
         ".epub": FileType.EPUB,
     }
 
+    # Longest time a scan is reused while the directory looks unchanged
+    SCAN_CACHE_TTL_SECONDS = 30.0
+
     def __init__(self, books_directory: str) -> None:
         """Initialize the book scanner.
 
@@ -46,6 +85,7 @@ class BookScanner:
             books_directory: Path to the directory containing book files.
         """
         self.books_directory = Path(books_directory).expanduser()
+        self._cached_scan: Optional[tuple[int, float, List[BookFile]]] = None
 
     def scan(self) -> List[BookFile]:
         """Scan the books directory for supported book files.
@@ -90,6 +130,47 @@ class BookScanner:
 
         return book_files
 
+    def scan_with_signature(
+        self,
+    ) -> tuple[List[BookFile], Optional[tuple[int, int, int]]]:
+        """Scan the books directory, reusing the last scan if it is unchanged.
+
+        The last scan is reused while the directory's modification time,
+        which changes whenever a book is added, removed or renamed, stays
+        the same, for at most SCAN_CACHE_TTL_SECONDS. The expiry picks up
+        books replaced in place and changes made within the same tick of a
+        coarse filesystem clock. The returned list is shared between calls
+        and must not be modified.
+
+        Returns:
+            Tuple of the book files, sorted by filename, and a signature of
+            the directory modification time, file count and total file
+            size, or None if the directory cannot be read.
+        """
+        try:
+            mtime_ns = self.books_directory.stat().st_mtime_ns
+        except OSError:
+            return self.scan(), None
+
+        now = time.monotonic()
+        cached = self._cached_scan
+        if (
+            cached is not None
+            and cached[0] == mtime_ns
+            and now - cached[1] < self.SCAN_CACHE_TTL_SECONDS
+        ):
+            book_files = cached[2]
+        else:
+            book_files = self.scan()
+            self._cached_scan = (mtime_ns, now, book_files)
+
+        signature = (
+            mtime_ns,
+            len(book_files),
+            sum(book.size_bytes for book in book_files),
+        )
+        return book_files, signature
+
     def get_book_by_name(self, filename: str) -> Optional[BookFile]:
         """Get a specific book file by filename.
 
@@ -114,8 +195,4 @@ class BookScanner:
         Returns:
             Human-readable size string (e.g., "1.5 MB").
         """
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        return format_size(size_bytes)
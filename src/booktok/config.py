@@ -63,6 +63,7 @@ class OpenRouterConfig:
     site_url: str = "https://github.com/namuan/book-tok"
     app_name: str = "BookTok"
     summary_page_count: int = 5
+    summary_concurrency: int = 4
 
 
 @dataclass
@@ -104,6 +105,15 @@ def load_config(config_path: Optional[str] = None) -> AppConfig:
                 f"Invalid BOOKTOK_SUMMARY_PAGE_COUNT value: {summary_count}, using default"
             )
 
+    summary_concurrency = os.environ.get("BOOKTOK_SUMMARY_CONCURRENCY")
+    if summary_concurrency:
+        try:
+            config.openrouter.summary_concurrency = int(summary_concurrency)
+        except ValueError:
+            logger.warning(
+                f"Invalid BOOKTOK_SUMMARY_CONCURRENCY value: {summary_concurrency}, using default"
+            )
+
     database_path = os.environ.get("BOOKTOK_DB_PATH")
 
     if database_path:
@@ -96,8 +96,8 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 first_name TEXT,
                 last_name TEXT,
                 timezone TEXT DEFAULT 'UTC',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
+                updated_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
             )
         """,
         ),
@@ -112,8 +112,8 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 file_type TEXT NOT NULL,
                 status TEXT DEFAULT 'pending',
                 total_snippets INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
+                updated_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
             )
         """,
         ),
@@ -125,7 +125,7 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 book_id INTEGER NOT NULL,
                 position INTEGER NOT NULL,
                 content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
                 UNIQUE(book_id, position)
             )
@@ -140,9 +140,9 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 book_id INTEGER NOT NULL,
                 current_position INTEGER DEFAULT 0,
                 is_completed INTEGER DEFAULT 0,
-                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
                 completed_at TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
                 UNIQUE(user_id, book_id)
@@ -161,8 +161,8 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 is_paused INTEGER DEFAULT 0,
                 last_delivered_at TIMESTAMP,
                 next_delivery_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
+                updated_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
                 FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
                 UNIQUE(user_id, book_id)
@@ -178,7 +178,7 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
                 start_position INTEGER NOT NULL,
                 end_position INTEGER NOT NULL,
                 summary_content TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now')),
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE,
                 UNIQUE(book_id, start_position, end_position)
             )
@@ -214,6 +214,18 @@ def create_tables(conn: sqlite3.Connection, verify_only: bool = False) -> None:
             "idx_delivery_schedules_next",
             "CREATE INDEX IF NOT EXISTS idx_delivery_schedules_next ON delivery_schedules(next_delivery_at)",
         ),
+        (
+            "idx_delivery_schedules_pending",
+            "CREATE INDEX IF NOT EXISTS idx_delivery_schedules_pending ON delivery_schedules(next_delivery_at) WHERE is_paused = 0",
+        ),
+        (
+            "idx_user_progress_user_updated",
+            "CREATE INDEX IF NOT EXISTS idx_user_progress_user_updated ON user_progress(user_id, updated_at DESC)",
+        ),
+        (
+            "idx_user_progress_user_active",
+            "CREATE INDEX IF NOT EXISTS idx_user_progress_user_active ON user_progress(user_id, updated_at DESC) WHERE is_completed = 0",
+        ),
         (
             "idx_snippet_summaries_book_id",
             "CREATE INDEX IF NOT EXISTS idx_snippet_summaries_book_id ON snippet_summaries(book_id)",
@@ -1,9 +1,10 @@
 """Delivery scheduler for managing user book snippet delivery schedules."""
 
 import asyncio
+import functools
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import Callable, Optional
 from zoneinfo import ZoneInfo
 
@@ -20,6 +21,31 @@ from booktok.repository import (
 
 logger = logging.getLogger(__name__)
 
+_UTC = ZoneInfo("UTC")
+
+_FREQUENCY_SHORT = {
+    Frequency.DAILY: "Daily",
+    Frequency.TWICE_DAILY: "2x/day",
+    Frequency.WEEKLY: "Weekly",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _tz_is_valid(name: str) -> bool:
+    """Check whether a timezone name resolves to a ZoneInfo.
+
+    Args:
+        name: IANA timezone name.
+
+    Returns:
+        True if the timezone is valid.
+    """
+    try:
+        ZoneInfo(name)
+    except Exception:
+        return False
+    return True
+
 
 class SchedulerError(Exception):
     """Base exception for scheduler errors."""
@@ -124,18 +150,21 @@ class DeliveryScheduler:
             InvalidTimezoneError: If timezone is invalid.
             InvalidScheduleError: If schedule parameters are invalid.
         """
-        user = self.user_repo.get_by_id(user_id)
-        if user is None:
-            raise UserNotFoundError(f"User with ID {user_id} not found")
-
         if timezone is not None:
+            user = self.user_repo.get_by_id(user_id)
+            if user is None:
+                raise UserNotFoundError(f"User with ID {user_id} not found")
             self._validate_timezone(timezone)
             if user.timezone != timezone:
                 user.timezone = timezone
                 self.user_repo.update(user)
                 logger.info(f"Updated timezone for user {user_id} to {timezone}")
-
-        effective_timezone = timezone or user.timezone
+            effective_timezone = timezone
+        else:
+            stored_timezone = self.user_repo.get_timezone(user_id)
+            if stored_timezone is None:
+                raise UserNotFoundError(f"User with ID {user_id} not found")
+            effective_timezone = stored_timezone
         next_delivery = self._calculate_next_delivery(
             delivery_time, frequency, effective_timezone
         )
@@ -267,14 +296,20 @@ class DeliveryScheduler:
         self.user_repo.update(user)
         logger.info(f"Updated timezone for user {user_id} to {timezone}")
 
-        for schedule in self.schedule_repo.list_by_user(user_id):
-            new_next_delivery = self._calculate_next_delivery(
-                schedule.delivery_time,
-                schedule.frequency,
-                timezone,
-            )
-            schedule.next_delivery_at = new_next_delivery
-            self.schedule_repo.update(schedule)
+        schedules = self.schedule_repo.list_by_user(user_id)
+        next_deliveries: dict[tuple[str, Frequency], datetime] = {}
+        for schedule in schedules:
+            key = (schedule.delivery_time, schedule.frequency)
+            if key not in next_deliveries:
+                next_deliveries[key] = self._calculate_next_delivery(
+                    schedule.delivery_time,
+                    schedule.frequency,
+                    timezone,
+                )
+            schedule.next_delivery_at = next_deliveries[key]
+
+        if schedules:
+            self.schedule_repo.update_many(schedules)
 
     def get_user_timezone(self, user_id: int) -> str:
         """Get the timezone for a user.
@@ -312,39 +347,50 @@ class DeliveryScheduler:
         user = self.user_repo.get_by_id(user_id)
         user_tz = user.timezone if user else "UTC"
 
-        lines = [
-            "📅 *Your Delivery Schedules*",
-            f"🌍 Timezone: {user_tz}",
-            "",
+        try:
+            tz: Optional[ZoneInfo] = ZoneInfo(user_tz)
+        except Exception:
+            tz = None
+
+        header = f"📅 *Your Delivery Schedules*\n🌍 Timezone: {user_tz}"
+        blocks = [
+            self._render_schedule_block(i, schedule, book_info, tz)
+            for i, schedule in enumerate(schedules, 1)
         ]
 
-        for i, schedule in enumerate(schedules, 1):
-            book_title, book_author = book_info.get(
-                schedule.book_id,
-                ("Unknown Book", None),
-            )
+        return f"{header}\n\n" + "\n\n".join(blocks) + "\n"
 
-            status_emoji = "🟢" if not schedule.is_paused else "⏸️"
-            freq_short = {
-                Frequency.DAILY: "Daily",
-                Frequency.TWICE_DAILY: "2x/day",
-                Frequency.WEEKLY: "Weekly",
-            }.get(schedule.frequency, "?")
-
-            lines.append(f"{i}. {status_emoji} *{book_title}*")
-            lines.append(f"   ⏰ {schedule.delivery_time} ({freq_short})")
-            if schedule.next_delivery_at:
-                try:
-                    tz = ZoneInfo(user_tz)
-                    local_next = schedule.next_delivery_at.replace(
-                        tzinfo=ZoneInfo("UTC")
-                    ).astimezone(tz)
-                    lines.append(f"   ⏭️ Next: {local_next.strftime('%b %d, %H:%M')}")
-                except Exception:
-                    pass
-            lines.append("")
+    def _render_schedule_block(
+        self,
+        index: int,
+        schedule: DeliverySchedule,
+        book_info: dict[int, tuple[str, Optional[str]]],
+        tz: Optional[ZoneInfo],
+    ) -> str:
+        """Render a single schedule entry for the schedules overview.
 
-        return "\n".join(lines)
+        Args:
+            index: 1-based position of the schedule in the list.
+            schedule: The schedule to render.
+            book_info: Mapping of book_id to (title, author) tuples.
+            tz: User's timezone, or None if it could not be resolved.
+
+        Returns:
+            Multi-line string describing the schedule.
+        """
+        book_title, _ = book_info.get(schedule.book_id, ("Unknown Book", None))
+        status_emoji = "🟢" if not schedule.is_paused else "⏸️"
+        freq_short = _FREQUENCY_SHORT.get(schedule.frequency, "?")
+
+        next_line = ""
+        if schedule.next_delivery_at and tz is not None:
+            local_next = schedule.next_delivery_at.replace(tzinfo=_UTC).astimezone(tz)
+            next_line = f"\n   ⏭️ Next: {local_next.strftime('%b %d, %H:%M')}"
+
+        return (
+            f"{index}. {status_emoji} *{book_title}*\n"
+            f"   ⏰ {schedule.delivery_time} ({freq_short}){next_line}"
+        )
 
     def pause_schedule(self, user_id: int, book_id: int) -> bool:
         """Pause automatic deliveries for a specific schedule.
@@ -459,10 +505,8 @@ class DeliveryScheduler:
         Raises:
             InvalidTimezoneError: If timezone is invalid.
         """
-        try:
-            ZoneInfo(timezone)
-        except Exception as e:
-            raise InvalidTimezoneError(f"Invalid timezone: {timezone}") from e
+        if not _tz_is_valid(timezone):
+            raise InvalidTimezoneError(f"Invalid timezone: {timezone}")
 
     def _calculate_next_delivery(
         self,
@@ -483,27 +527,18 @@ class DeliveryScheduler:
         try:
             tz = ZoneInfo(timezone)
         except Exception:
-            tz = ZoneInfo("UTC")
+            tz = _UTC
 
-        now_utc = datetime.now(ZoneInfo("UTC"))
-        now_local = now_utc.astimezone(tz)
+        now_local = datetime.now(tz)
 
         hour, minute = map(int, delivery_time.split(":"))
 
-        next_local = now_local.replace(
-            hour=hour,
-            minute=minute,
-            second=0,
-            microsecond=0,
-        )
+        next_local = datetime.combine(now_local.date(), time(hour, minute, tzinfo=tz))
 
         if next_local <= now_local:
-            if frequency == Frequency.DAILY or frequency == Frequency.TWICE_DAILY:
-                next_local += timedelta(days=1)
-            elif frequency == Frequency.WEEKLY:
-                next_local += timedelta(weeks=1)
+            next_local += timedelta(days=7 if frequency == Frequency.WEEKLY else 1)
 
-        return next_local.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+        return next_local.astimezone(_UTC).replace(tzinfo=None)
 
 
 @dataclass
@@ -791,7 +826,7 @@ class AutomatedDeliveryRunner:
 
             if progress.current_position >= total_snippets:
                 progress.is_completed = True
-                progress.completed_at = datetime.utcnow()
+                progress.completed_at = datetime.now(_UTC).replace(tzinfo=None)
 
                 congratulatory = (
                     f"🎉 *Congratulations!*\n\n"
@@ -1,12 +1,14 @@
 """Data models for the BookTok Telegram bot."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from typing import Generator, Optional
 
 
-class BookStatus(Enum):
+class BookStatus(StrEnum):
     """Status of book processing."""
 
     PENDING = "pending"
@@ -15,14 +17,14 @@ class BookStatus(Enum):
     FAILED = "failed"
 
 
-class FileType(Enum):
+class FileType(StrEnum):
     """Supported book file types."""
 
     PDF = "pdf"
     EPUB = "epub"
 
 
-class Frequency(Enum):
+class Frequency(StrEnum):
     """Delivery frequency options."""
 
     DAILY = "daily"
@@ -34,6 +36,22 @@ class ValidationError(Exception):
     """Raised when model validation fails."""
 
 
+_VALIDATE_ON_INIT: ContextVar[bool] = ContextVar("validate_on_init", default=True)
+
+
+@contextmanager
+def validation_disabled() -> Generator[None, None, None]:
+    """Skip ``__post_init__`` validation for models created inside the block.
+
+    Intended for hydrating rows that were already validated when written.
+    """
+    token = _VALIDATE_ON_INIT.set(False)
+    try:
+        yield
+    finally:
+        _VALIDATE_ON_INIT.reset(token)
+
+
 @dataclass
 class User:
     """Represents a Telegram user of the bot."""
@@ -68,7 +86,8 @@ class User:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
 
 
 @dataclass
@@ -106,10 +125,11 @@ class Book:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
 
 
-@dataclass
+@dataclass(slots=True)
 class Snippet:
     """Represents a learning snippet extracted from a book."""
 
@@ -134,7 +154,8 @@ class Snippet:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
 
 
 @dataclass
@@ -167,7 +188,8 @@ class UserProgress:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
 
 
 @dataclass
@@ -229,10 +251,11 @@ class DeliverySchedule:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
 
 
-@dataclass
+@dataclass(slots=True)
 class SnippetSummary:
     """Represents a pre-generated summary for a range of snippets."""
 
@@ -262,4 +285,5 @@ class SnippetSummary:
 
     def __post_init__(self) -> None:
         """Validate after initialization."""
-        self.validate()
+        if _VALIDATE_ON_INIT.get():
+            self.validate()
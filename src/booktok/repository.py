@@ -1,10 +1,15 @@
 """Database repositories implementing CRUD operations for all models."""
 
+import copy
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime
+from itertools import starmap
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Generator, Hashable, Optional
 
 from booktok.database import create_tables
 from booktok.models import (
@@ -17,38 +22,409 @@ from booktok.models import (
     SnippetSummary,
     User,
     UserProgress,
+    validation_disabled,
 )
 
 
+def _parse_datetime(value: bytes | str | None) -> Optional[datetime]:
+    """Parse a TIMESTAMP value from the database.
+
+    Handles ISO 8601 strings with either a ``T`` or a space separator, so
+    rows written with SQLite's ``CURRENT_TIMESTAMP`` by older schemas
+    still parse. Registered as the sqlite3
+    converter for TIMESTAMP columns, and usable directly on values read
+    from connections opened without ``detect_types``.
+
+    Args:
+        value: Raw column bytes or string, or None.
+
+    Returns:
+        Parsed datetime, or None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode()
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+sqlite3.register_converter("TIMESTAMP", _parse_datetime)
+
+# Size of each connection's prepared-statement cache. sqlite3 keys the cache
+# on the SQL text, and every statement below is a module constant, so with
+# fewer distinct statements than slots each one is prepared once per
+# connection and reused for the life of that connection.
+_STATEMENT_CACHE_SIZE = 256
+
+# Page cache for the main thread's connection, which serves nearly every
+# query, and for the connections of executor threads. The default executor
+# can run dozens of threads, each keeping its connection until shutdown, so
+# those connections get a small cache and no memory map.
+_MAIN_CACHE_SIZE_KIB = 65536
+_WORKER_CACHE_SIZE_KIB = 2048
+_MAIN_MMAP_SIZE = 268435456
+
+# Current UTC time in the same ISO 8601 form that datetime.isoformat()
+# produces, so every stored timestamp shares one format.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now')"
+
+# Column lists follow the positional field order of the matching model so
+# rows can be unpacked straight into the constructor.
+_USER_COLUMNS = (
+    "telegram_id, username, first_name, last_name, timezone, id, "
+    "created_at, updated_at"
+)
+_SQL_INSERT_USER = (
+    "INSERT INTO users (telegram_id, username, first_name, last_name, timezone) "
+    "VALUES (?, ?, ?, ?, ?) RETURNING id"
+)
+_SQL_GET_USER_BY_ID = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+_SQL_GET_USER_BY_TELEGRAM_ID = (
+    f"SELECT {_USER_COLUMNS} FROM users WHERE telegram_id = ?"
+)
+_SQL_GET_USER_TIMEZONE = "SELECT timezone FROM users WHERE id = ?"
+_SQL_UPDATE_USER = (
+    "UPDATE users SET username = ?, first_name = ?, last_name = ?, timezone = ?, "
+    f"updated_at = {_SQL_NOW} WHERE id = ?"
+)
+_SQL_UPSERT_USER = (
+    "INSERT INTO users (telegram_id, username, first_name, last_name, timezone) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(telegram_id) DO UPDATE SET "
+    "username = excluded.username, "
+    "first_name = excluded.first_name, "
+    "last_name = excluded.last_name, "
+    f"updated_at = {_SQL_NOW} "
+    "RETURNING id"
+)
+_SQL_DELETE_USER = "DELETE FROM users WHERE id = ?"
+_SQL_LIST_USERS = f"SELECT {_USER_COLUMNS} FROM users ORDER BY id DESC"
+
+_BOOK_COLUMNS = (
+    "title, file_path, file_type, author, status, total_snippets, id, "
+    "created_at, updated_at"
+)
+_SQL_INSERT_BOOK = (
+    "INSERT INTO books (title, author, file_path, file_type, status, total_snippets) "
+    "VALUES (?, ?, ?, ?, ?, ?) RETURNING id"
+)
+_SQL_GET_BOOK_BY_ID = f"SELECT {_BOOK_COLUMNS} FROM books WHERE id = ?"
+_SQL_GET_BOOK_BY_FILE_PATH = f"SELECT {_BOOK_COLUMNS} FROM books WHERE file_path = ?"
+_SQL_UPDATE_BOOK = (
+    "UPDATE books SET title = ?, author = ?, file_path = ?, file_type = ?, "
+    f"status = ?, total_snippets = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+)
+_SQL_DELETE_BOOK = "DELETE FROM books WHERE id = ?"
+_SQL_LIST_BOOKS = f"SELECT {_BOOK_COLUMNS} FROM books ORDER BY id DESC"
+_SQL_LIST_BOOKS_BY_STATUS = (
+    f"SELECT {_BOOK_COLUMNS} FROM books WHERE status = ? ORDER BY id DESC"
+)
+
+_SNIPPET_COLUMNS = "book_id, position, content, id, created_at"
+_SQL_INSERT_SNIPPET = (
+    "INSERT INTO snippets (book_id, position, content) VALUES (?, ?, ?)"
+)
+# executemany() rejects RETURNING, so bulk inserts use the plain statement
+_SQL_INSERT_SNIPPET_RETURNING_ID = f"{_SQL_INSERT_SNIPPET} RETURNING id"
+_SQL_LAST_INSERT_ROWID = "SELECT last_insert_rowid()"
+_BULK_INSERT_CHUNK_SIZE = 5000
+_SQL_GET_SNIPPET_BY_ID = f"SELECT {_SNIPPET_COLUMNS} FROM snippets WHERE id = ?"
+_SQL_GET_SNIPPET_BY_POSITION = (
+    f"SELECT {_SNIPPET_COLUMNS} FROM snippets WHERE book_id = ? AND position = ?"
+)
+_SQL_GET_SNIPPET_RANGE = (
+    f"SELECT {_SNIPPET_COLUMNS} FROM snippets "
+    "WHERE book_id = ? AND position >= ? AND position <= ? ORDER BY position ASC"
+)
+_SQL_GET_SNIPPET_CONTENTS_RANGE = (
+    "SELECT content FROM snippets "
+    "WHERE book_id = ? AND position >= ? AND position <= ? ORDER BY position ASC"
+)
+_SQL_LIST_SNIPPETS_BY_BOOK = (
+    f"SELECT {_SNIPPET_COLUMNS} FROM snippets WHERE book_id = ? ORDER BY position ASC"
+)
+_SQL_UPDATE_SNIPPET = (
+    "UPDATE snippets SET book_id = ?, position = ?, content = ? WHERE id = ?"
+)
+_SQL_DELETE_SNIPPET = "DELETE FROM snippets WHERE id = ?"
+_SQL_DELETE_SNIPPETS_BY_BOOK = "DELETE FROM snippets WHERE book_id = ?"
+_SQL_COUNT_SNIPPETS_BY_BOOK = (
+    "SELECT COUNT(*) as count FROM snippets WHERE book_id = ?"
+)
+
+_PROGRESS_COLUMNS = (
+    "user_id, book_id, current_position, is_completed, id, started_at, "
+    "completed_at, updated_at"
+)
+_SQL_INSERT_PROGRESS = (
+    "INSERT INTO user_progress (user_id, book_id, current_position, is_completed) "
+    "VALUES (?, ?, ?, ?) RETURNING id"
+)
+_SQL_INSERT_PROGRESS_IF_MISSING = (
+    "INSERT INTO user_progress (user_id, book_id, current_position, is_completed) "
+    "VALUES (?, ?, 0, 0) ON CONFLICT(user_id, book_id) DO NOTHING "
+    f"RETURNING {_PROGRESS_COLUMNS}"
+)
+_SQL_GET_PROGRESS_BY_ID = f"SELECT {_PROGRESS_COLUMNS} FROM user_progress WHERE id = ?"
+_SQL_GET_PROGRESS_BY_USER_AND_BOOK = (
+    f"SELECT {_PROGRESS_COLUMNS} FROM user_progress WHERE user_id = ? AND book_id = ?"
+)
+_SQL_LIST_PROGRESS_BY_USER = (
+    f"SELECT {_PROGRESS_COLUMNS} FROM user_progress "
+    "WHERE user_id = ? ORDER BY updated_at DESC"
+)
+_SQL_GET_ACTIVE_PROGRESS = (
+    f"SELECT {_PROGRESS_COLUMNS} FROM user_progress "
+    "WHERE user_id = ? AND is_completed = 0 ORDER BY updated_at DESC LIMIT 1"
+)
+_SQL_UPDATE_PROGRESS = (
+    "UPDATE user_progress SET current_position = ?, is_completed = ?, "
+    f"completed_at = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+)
+_SQL_TOUCH_PROGRESS = f"UPDATE user_progress SET updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_DELETE_PROGRESS = "DELETE FROM user_progress WHERE id = ?"
+
+_SCHEDULE_COLUMNS = (
+    "user_id, book_id, delivery_time, frequency, is_paused, id, "
+    "last_delivered_at, next_delivery_at, created_at, updated_at"
+)
+_SQL_INSERT_SCHEDULE = (
+    "INSERT INTO delivery_schedules "
+    "(user_id, book_id, delivery_time, frequency, is_paused, next_delivery_at) "
+    "VALUES (?, ?, ?, ?, ?, ?) RETURNING id"
+)
+_SQL_GET_SCHEDULE_BY_ID = (
+    f"SELECT {_SCHEDULE_COLUMNS} FROM delivery_schedules WHERE id = ?"
+)
+_SQL_GET_SCHEDULE_BY_USER_AND_BOOK = (
+    f"SELECT {_SCHEDULE_COLUMNS} FROM delivery_schedules "
+    "WHERE user_id = ? AND book_id = ?"
+)
+_SQL_LIST_SCHEDULES_BY_USER = (
+    f"SELECT {_SCHEDULE_COLUMNS} FROM delivery_schedules "
+    "WHERE user_id = ? ORDER BY id DESC"
+)
+_SQL_LIST_PENDING_SCHEDULES = (
+    f"SELECT {_SCHEDULE_COLUMNS} FROM delivery_schedules "
+    "WHERE is_paused = 0 AND next_delivery_at <= ? ORDER BY next_delivery_at ASC"
+)
+_SQL_UPDATE_SCHEDULE = (
+    "UPDATE delivery_schedules SET delivery_time = ?, frequency = ?, is_paused = ?, "
+    f"last_delivered_at = ?, next_delivery_at = ?, updated_at = {_SQL_NOW} "
+    "WHERE id = ?"
+)
+_SQL_DELETE_SCHEDULE = "DELETE FROM delivery_schedules WHERE id = ?"
+
+_SQL_CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS migrations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE NOT NULL,
+        applied_at TIMESTAMP DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+    )
+"""
+_SQL_MIGRATION_APPLIED = "SELECT 1 FROM migrations WHERE name = ?"
+_SQL_INSERT_MIGRATION = "INSERT INTO migrations (name) VALUES (?)"
+_SQL_LIST_MIGRATIONS = "SELECT name FROM migrations ORDER BY applied_at ASC"
+
+_SUMMARY_COLUMNS = (
+    "book_id, start_position, end_position, summary_content, id, created_at"
+)
+_SQL_INSERT_SUMMARY = (
+    "INSERT INTO snippet_summaries "
+    "(book_id, start_position, end_position, summary_content) "
+    "VALUES (?, ?, ?, ?) RETURNING id"
+)
+_SQL_INSERT_SUMMARY_IF_MISSING = (
+    "INSERT INTO snippet_summaries "
+    "(book_id, start_position, end_position, summary_content) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(book_id, start_position, end_position) DO NOTHING"
+)
+_SQL_GET_SUMMARY_BY_ID = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM snippet_summaries WHERE id = ?"
+)
+_SQL_GET_SUMMARY_BY_POSITION = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM snippet_summaries "
+    "WHERE book_id = ? AND start_position = ? AND end_position = ?"
+)
+_SQL_LIST_SUMMARIES_BY_BOOK = (
+    f"SELECT {_SUMMARY_COLUMNS} FROM snippet_summaries "
+    "WHERE book_id = ? ORDER BY start_position ASC"
+)
+_SQL_LIST_SUMMARY_RANGES_BY_BOOK = (
+    "SELECT start_position, end_position FROM snippet_summaries WHERE book_id = ?"
+)
+_SQL_DELETE_SUMMARY = "DELETE FROM snippet_summaries WHERE id = ?"
+_SQL_DELETE_SUMMARIES_BY_BOOK = "DELETE FROM snippet_summaries WHERE book_id = ?"
+
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Create a cursor that returns plain tuples instead of sqlite3.Row.
+
+    Used by list queries, where building a Row per result is wasted work
+    because rows are unpacked positionally.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Cursor with no row factory.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time.
+
+    Values are returned as shallow copies so callers can mutate the models
+    they get back without altering the cached entry.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the
+                least recently used one.
+            ttl: Seconds an entry stays valid after it is stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached value, or None if missing or expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Copy of the cached value, or None.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return copy.copy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a copy of a value.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, copy.copy(value))
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
 class DatabaseConnectionManager:
-    """Manages SQLite database connections with context manager support."""
+    """Manages SQLite database connections with context manager support.
+
+    Each thread gets its own long-lived connection, so work offloaded to
+    executor threads never shares a connection with the event loop thread.
+    """
 
     def __init__(self, db_path: str | Path = "booktok.db") -> None:
         """Initialize the connection manager.
 
         Args:
-            db_path: Path to the SQLite database file.
-        """
-        self.db_path = Path(db_path)
-        self._connection: Optional[sqlite3.Connection] = None
+            db_path: Path to the SQLite database file. Stored as given,
+                since sqlite3.connect accepts both str and Path.
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Shared by every repository on this database so that a write
+        # through one repository instance invalidates lookups in the others.
+        self.user_cache = _TTLCache()
+        self.book_cache = _TTLCache()
 
     def connect(self) -> sqlite3.Connection:
-        """Establish a database connection.
+        """Establish a database connection for the calling thread.
 
         Returns:
             Active database connection.
         """
-        if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path)
-            self._connection.row_factory = sqlite3.Row
-            self._connection.execute("PRAGMA foreign_keys = ON")
-        return self._connection
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = self._open_connection()
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new SQLite connection.
+
+        Returns:
+            Configured database connection.
+        """
+        # Connections are only used by the thread that opened them, but
+        # close() may run on a different thread at shutdown.
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        connection.row_factory = sqlite3.Row
+        # journal_mode must be switched outside of a transaction
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        # Truncate the WAL back to 64 MiB after checkpoints, so a burst of
+        # summary or snippet inserts does not leave a large file behind
+        connection.execute("PRAGMA journal_size_limit = 67108864")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        if threading.current_thread() is threading.main_thread():
+            connection.execute(f"PRAGMA mmap_size = {_MAIN_MMAP_SIZE}")
+            connection.execute(f"PRAGMA cache_size = -{_MAIN_CACHE_SIZE_KIB}")
+        else:
+            connection.execute(f"PRAGMA cache_size = -{_WORKER_CACHE_SIZE_KIB}")
+        connection.execute("PRAGMA busy_timeout = 5000")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Close all database connections opened by this manager."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        self.user_cache.clear()
+        self.book_cache.clear()
+        for connection in connections:
+            connection.execute("PRAGMA optimize")
+            connection.close()
 
     def initialize(self) -> None:
         """Initialize the database schema."""
@@ -56,9 +432,15 @@ class DatabaseConnectionManager:
         create_tables(conn)
 
     @contextmanager
-    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+    def transaction(
+        self, immediate: bool = False
+    ) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database transactions with automatic commit/rollback.
 
+        Args:
+            immediate: Take the write lock up front with ``BEGIN IMMEDIATE``
+                instead of upgrading a deferred transaction on first write.
+
         Yields:
             Active database connection within a transaction.
 
@@ -66,6 +448,8 @@ class DatabaseConnectionManager:
             Exception: Re-raises any exception after rollback.
         """
         conn = self.connect()
+        if immediate and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
         try:
             yield conn
             conn.commit()
@@ -76,10 +460,17 @@ class DatabaseConnectionManager:
     def get_connection(self) -> sqlite3.Connection:
         """Get the current connection, creating one if needed.
 
+        Repositories call this once per query, so the common case is a
+        single thread-local attribute read; connect() only runs the first
+        time a thread asks for a connection.
+
         Returns:
             Active database connection.
         """
-        return self.connect()
+        try:
+            return self._local.connection
+        except AttributeError:
+            return self.connect()
 
 
 class UserRepository:
@@ -92,6 +483,7 @@ class UserRepository:
             db_manager: Database connection manager.
         """
         self.db = db_manager
+        self._cache = db_manager.user_cache
 
     def create(self, user: User) -> User:
         """Create a new user in the database.
@@ -104,10 +496,7 @@ class UserRepository:
         """
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO users (telegram_id, username, first_name, last_name, timezone)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_USER,
                 (
                     user.telegram_id,
                     user.username,
@@ -116,7 +505,7 @@ class UserRepository:
                     user.timezone,
                 ),
             )
-            user.id = cursor.lastrowid
+            user.id = cursor.fetchone()[0]
         return user
 
     def get_by_id(self, user_id: int) -> Optional[User]:
@@ -128,10 +517,18 @@ class UserRepository:
         Returns:
             User if found, None otherwise.
         """
+        key = ("id", user_id)
+        user = self._cache.get(key)
+        if user is not None:
+            return user
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        cursor = conn.execute(_SQL_GET_USER_BY_ID, (user_id,))
         row = cursor.fetchone()
-        return self._row_to_user(row) if row else None
+        if row is None:
+            return None
+        user = self._row_to_user(row)
+        self._cache.set(key, user)
+        return user
 
     def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Retrieve a user by Telegram ID.
@@ -142,12 +539,32 @@ class UserRepository:
         Returns:
             User if found, None otherwise.
         """
+        key = ("telegram_id", telegram_id)
+        user = self._cache.get(key)
+        if user is not None:
+            return user
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM users WHERE telegram_id = ?", (telegram_id,)
-        )
+        cursor = conn.execute(_SQL_GET_USER_BY_TELEGRAM_ID, (telegram_id,))
         row = cursor.fetchone()
-        return self._row_to_user(row) if row else None
+        if row is None:
+            return None
+        user = self._row_to_user(row)
+        self._cache.set(key, user)
+        return user
+
+    def get_timezone(self, user_id: int) -> Optional[str]:
+        """Retrieve only the timezone of a user.
+
+        Args:
+            user_id: Database ID of the user.
+
+        Returns:
+            Timezone name if the user exists, None otherwise.
+        """
+        conn = self.db.get_connection()
+        cursor = conn.execute(_SQL_GET_USER_TIMEZONE, (user_id,))
+        row = cursor.fetchone()
+        return row["timezone"] if row else None
 
     def update(self, user: User) -> User:
         """Update an existing user.
@@ -165,11 +582,7 @@ class UserRepository:
             raise ValueError("Cannot update user without ID")
         with self.db.transaction() as conn:
             conn.execute(
-                """
-                UPDATE users
-                SET username = ?, first_name = ?, last_name = ?, timezone = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_USER,
                 (
                     user.username,
                     user.first_name,
@@ -178,6 +591,37 @@ class UserRepository:
                     user.id,
                 ),
             )
+        self._cache.pop(("id", user.id))
+        self._cache.pop(("telegram_id", user.telegram_id))
+        return user
+
+    def upsert(self, user: User) -> User:
+        """Create a user or refresh the profile of an existing one.
+
+        Uses a single ``INSERT ... ON CONFLICT DO UPDATE`` keyed on
+        ``telegram_id``. An existing user keeps their timezone; only the
+        username and names are overwritten.
+
+        Args:
+            user: User object to write.
+
+        Returns:
+            User with its database ID set.
+        """
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                _SQL_UPSERT_USER,
+                (
+                    user.telegram_id,
+                    user.username,
+                    user.first_name,
+                    user.last_name,
+                    user.timezone,
+                ),
+            )
+            user.id = cursor.fetchone()[0]
+        self._cache.pop(("id", user.id))
+        self._cache.pop(("telegram_id", user.telegram_id))
         return user
 
     def delete(self, user_id: int) -> bool:
@@ -190,8 +634,12 @@ class UserRepository:
             True if user was deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
-            return cursor.rowcount > 0
+            cursor = conn.execute(_SQL_DELETE_USER, (user_id,))
+            deleted = cursor.rowcount > 0
+        # The Telegram ID key is unknown here; deletes are rare enough
+        # that dropping every cached user is simpler than tracking it.
+        self._cache.clear()
+        return deleted
 
     def list_all(self) -> list[User]:
         """Retrieve all users.
@@ -200,44 +648,20 @@ class UserRepository:
             List of all users.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM users ORDER BY created_at DESC")
-        return [self._row_to_user(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_USERS)
+        with validation_disabled():
+            return [self._row_to_user(row) for row in cursor]
 
-    def _row_to_user(self, row: sqlite3.Row) -> User:
+    def _row_to_user(self, row: sqlite3.Row | tuple) -> User:
         """Convert a database row to a User object.
 
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             User object.
         """
-        return User(
-            id=row["id"],
-            telegram_id=row["telegram_id"],
-            username=row["username"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            timezone=row["timezone"],
-            created_at=self._parse_datetime(row["created_at"]),
-            updated_at=self._parse_datetime(row["updated_at"]),
-        )
-
-    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a datetime string from the database.
-
-        Args:
-            value: Datetime string or None.
-
-        Returns:
-            datetime object or None.
-        """
-        if value is None:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace(" ", "T"))
-        except (ValueError, AttributeError):
-            return None
+        return User(*row)
 
 
 class BookRepository:
@@ -250,6 +674,7 @@ class BookRepository:
             db_manager: Database connection manager.
         """
         self.db = db_manager
+        self._cache = db_manager.book_cache
 
     def create(self, book: Book) -> Book:
         """Create a new book in the database.
@@ -262,20 +687,17 @@ class BookRepository:
         """
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO books (title, author, file_path, file_type, status, total_snippets)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_BOOK,
                 (
                     book.title,
                     book.author,
                     book.file_path,
-                    book.file_type.value,
-                    book.status.value,
+                    book.file_type,
+                    book.status,
                     book.total_snippets,
                 ),
             )
-            book.id = cursor.lastrowid
+            book.id = cursor.fetchone()[0]
         return book
 
     def get_by_id(self, book_id: int) -> Optional[Book]:
@@ -287,10 +709,17 @@ class BookRepository:
         Returns:
             Book if found, None otherwise.
         """
+        book = self._cache.get(book_id)
+        if book is not None:
+            return book
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM books WHERE id = ?", (book_id,))
+        cursor = conn.execute(_SQL_GET_BOOK_BY_ID, (book_id,))
         row = cursor.fetchone()
-        return self._row_to_book(row) if row else None
+        if row is None:
+            return None
+        book = self._row_to_book(row)
+        self._cache.set(book_id, book)
+        return book
 
     def get_by_file_path(self, file_path: str) -> Optional[Book]:
         """Retrieve a book by file path.
@@ -302,7 +731,7 @@ class BookRepository:
             Book if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM books WHERE file_path = ?", (file_path,))
+        cursor = conn.execute(_SQL_GET_BOOK_BY_FILE_PATH, (file_path,))
         row = cursor.fetchone()
         return self._row_to_book(row) if row else None
 
@@ -322,24 +751,56 @@ class BookRepository:
             raise ValueError("Cannot update book without ID")
         with self.db.transaction() as conn:
             conn.execute(
-                """
-                UPDATE books
-                SET title = ?, author = ?, file_path = ?, file_type = ?, status = ?,
-                    total_snippets = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_BOOK,
                 (
                     book.title,
                     book.author,
                     book.file_path,
-                    book.file_type.value,
-                    book.status.value,
+                    book.file_type,
+                    book.status,
                     book.total_snippets,
                     book.id,
                 ),
             )
+        self._cache.pop(book.id)
         return book
 
+    def reset_for_processing(self, book: Book) -> int:
+        """Mark a book as processing and delete its existing snippets.
+
+        Both changes commit in one transaction, so a book is never left
+        with its old status but without its snippets.
+
+        Args:
+            book: Book to reprocess. Its status is set to PROCESSING.
+
+        Returns:
+            Number of snippets deleted.
+
+        Raises:
+            ValueError: If book has no ID.
+        """
+        if book.id is None:
+            raise ValueError("Cannot reset book without ID")
+        book.status = BookStatus.PROCESSING
+        with self.db.transaction(immediate=True) as conn:
+            conn.execute(
+                _SQL_UPDATE_BOOK,
+                (
+                    book.title,
+                    book.author,
+                    book.file_path,
+                    book.file_type,
+                    book.status,
+                    book.total_snippets,
+                    book.id,
+                ),
+            )
+            cursor = conn.execute(_SQL_DELETE_SNIPPETS_BY_BOOK, (book.id,))
+            deleted = cursor.rowcount
+        self._cache.pop(book.id)
+        return deleted
+
     def delete(self, book_id: int) -> bool:
         """Delete a book by ID.
 
@@ -350,8 +811,10 @@ class BookRepository:
             True if book was deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute("DELETE FROM books WHERE id = ?", (book_id,))
-            return cursor.rowcount > 0
+            cursor = conn.execute(_SQL_DELETE_BOOK, (book_id,))
+            deleted = cursor.rowcount > 0
+        self._cache.pop(book_id)
+        return deleted
 
     def list_all(self) -> list[Book]:
         """Retrieve all books.
@@ -360,8 +823,9 @@ class BookRepository:
             List of all books.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM books ORDER BY created_at DESC")
-        return [self._row_to_book(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_BOOKS)
+        with validation_disabled():
+            return [self._row_to_book(row) for row in cursor]
 
     def list_by_status(self, status: BookStatus) -> list[Book]:
         """Retrieve books by status.
@@ -373,42 +837,24 @@ class BookRepository:
             List of books with the given status.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM books WHERE status = ? ORDER BY created_at DESC",
-            (status.value,),
-        )
-        return [self._row_to_book(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_BOOKS_BY_STATUS, (status,))
+        with validation_disabled():
+            return [self._row_to_book(row) for row in cursor]
 
-    def _row_to_book(self, row: sqlite3.Row) -> Book:
+    def _row_to_book(self, row: sqlite3.Row | tuple) -> Book:
         """Convert a database row to a Book object.
 
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             Book object.
         """
+        title, file_path, file_type, author, status, *rest = row
         return Book(
-            id=row["id"],
-            title=row["title"],
-            author=row["author"],
-            file_path=row["file_path"],
-            file_type=FileType(row["file_type"]),
-            status=BookStatus(row["status"]),
-            total_snippets=row["total_snippets"],
-            created_at=self._parse_datetime(row["created_at"]),
-            updated_at=self._parse_datetime(row["updated_at"]),
+            title, file_path, FileType(file_type), author, BookStatus(status), *rest
         )
 
-    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a datetime string from the database."""
-        if value is None:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace(" ", "T"))
-        except (ValueError, AttributeError):
-            return None
-
 
 class SnippetRepository:
     """Repository for Snippet CRUD operations."""
@@ -432,34 +878,44 @@ class SnippetRepository:
         """
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO snippets (book_id, position, content)
-                VALUES (?, ?, ?)
-                """,
+                _SQL_INSERT_SNIPPET_RETURNING_ID,
                 (snippet.book_id, snippet.position, snippet.content),
             )
-            snippet.id = cursor.lastrowid
+            snippet.id = cursor.fetchone()[0]
         return snippet
 
     def create_bulk(self, snippets: list[Snippet]) -> list[Snippet]:
         """Create multiple snippets in a single transaction.
 
+        Rows are inserted in chunks of ``_BULK_INSERT_CHUNK_SIZE`` inside one
+        immediate transaction, with foreign key checks deferred to commit.
+        IDs are backfilled from ``last_insert_rowid()``: SQLite allows a
+        single writer per transaction, so the rows inserted by one
+        ``executemany`` receive consecutive rowids.
+
         Args:
             snippets: List of Snippet objects to create.
 
         Returns:
             List of Snippets with assigned IDs.
         """
-        with self.db.transaction() as conn:
-            for snippet in snippets:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO snippets (book_id, position, content)
-                    VALUES (?, ?, ?)
-                    """,
-                    (snippet.book_id, snippet.position, snippet.content),
+        if not snippets:
+            return snippets
+        with self.db.transaction(immediate=True) as conn:
+            conn.execute("PRAGMA defer_foreign_keys = ON")
+            for start in range(0, len(snippets), _BULK_INSERT_CHUNK_SIZE):
+                chunk = snippets[start : start + _BULK_INSERT_CHUNK_SIZE]
+                # Binding rows one by one is cheaper here than a single
+                # json_each() INSERT ... SELECT: for snippet-sized text,
+                # encoding and re-parsing the JSON costs more than it saves
+                conn.executemany(
+                    _SQL_INSERT_SNIPPET,
+                    [(s.book_id, s.position, s.content) for s in chunk],
                 )
-                snippet.id = cursor.lastrowid
+                last_id = conn.execute(_SQL_LAST_INSERT_ROWID).fetchone()[0]
+                first_id = last_id - len(chunk) + 1
+                for offset, snippet in enumerate(chunk):
+                    snippet.id = first_id + offset
         return snippets
 
     def get_by_id(self, snippet_id: int) -> Optional[Snippet]:
@@ -472,7 +928,7 @@ class SnippetRepository:
             Snippet if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT * FROM snippets WHERE id = ?", (snippet_id,))
+        cursor = conn.execute(_SQL_GET_SNIPPET_BY_ID, (snippet_id,))
         row = cursor.fetchone()
         return self._row_to_snippet(row) if row else None
 
@@ -489,10 +945,7 @@ class SnippetRepository:
             Snippet if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM snippets WHERE book_id = ? AND position = ?",
-            (book_id, position),
-        )
+        cursor = conn.execute(_SQL_GET_SNIPPET_BY_POSITION, (book_id, position))
         row = cursor.fetchone()
         return self._row_to_snippet(row) if row else None
 
@@ -510,15 +963,33 @@ class SnippetRepository:
             List of snippets ordered by position.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            """
-            SELECT * FROM snippets
-            WHERE book_id = ? AND position >= ? AND position <= ?
-            ORDER BY position ASC
-            """,
-            (book_id, start_position, end_position),
+        cursor = _tuple_cursor(conn).execute(
+            _SQL_GET_SNIPPET_RANGE, (book_id, start_position, end_position)
         )
-        return [self._row_to_snippet(row) for row in cursor.fetchall()]
+        with validation_disabled():
+            return list(starmap(Snippet, cursor))
+
+    def get_contents_in_range(
+        self, book_id: int, start_position: int, end_position: int
+    ) -> list[str]:
+        """Retrieve only the content of a range of snippets for a book.
+
+        For callers that need the text alone, this skips building a
+        Snippet for every row.
+
+        Args:
+            book_id: Database ID of the book.
+            start_position: Starting position (inclusive).
+            end_position: Ending position (inclusive).
+
+        Returns:
+            List of snippet contents ordered by position.
+        """
+        conn = self.db.get_connection()
+        cursor = _tuple_cursor(conn).execute(
+            _SQL_GET_SNIPPET_CONTENTS_RANGE, (book_id, start_position, end_position)
+        )
+        return [row[0] for row in cursor]
 
     def list_by_book(self, book_id: int) -> list[Snippet]:
         """Retrieve all snippets for a book.
@@ -530,11 +1001,9 @@ class SnippetRepository:
             List of snippets ordered by position.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM snippets WHERE book_id = ? ORDER BY position ASC",
-            (book_id,),
-        )
-        return [self._row_to_snippet(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_SNIPPETS_BY_BOOK, (book_id,))
+        with validation_disabled():
+            return list(starmap(Snippet, cursor))
 
     def update(self, snippet: Snippet) -> Snippet:
         """Update an existing snippet.
@@ -552,10 +1021,7 @@ class SnippetRepository:
             raise ValueError("Cannot update snippet without ID")
         with self.db.transaction() as conn:
             conn.execute(
-                """
-                UPDATE snippets SET book_id = ?, position = ?, content = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_SNIPPET,
                 (snippet.book_id, snippet.position, snippet.content, snippet.id),
             )
         return snippet
@@ -570,7 +1036,7 @@ class SnippetRepository:
             True if snippet was deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute("DELETE FROM snippets WHERE id = ?", (snippet_id,))
+            cursor = conn.execute(_SQL_DELETE_SNIPPET, (snippet_id,))
             return cursor.rowcount > 0
 
     def delete_by_book(self, book_id: int) -> int:
@@ -583,7 +1049,7 @@ class SnippetRepository:
             Number of snippets deleted.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute("DELETE FROM snippets WHERE book_id = ?", (book_id,))
+            cursor = conn.execute(_SQL_DELETE_SNIPPETS_BY_BOOK, (book_id,))
             return cursor.rowcount
 
     def count_by_book(self, book_id: int) -> int:
@@ -596,38 +1062,23 @@ class SnippetRepository:
             Number of snippets.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT COUNT(*) as count FROM snippets WHERE book_id = ?",
-            (book_id,),
-        )
+        cursor = conn.execute(_SQL_COUNT_SNIPPETS_BY_BOOK, (book_id,))
         row = cursor.fetchone()
         return row["count"] if row else 0
 
-    def _row_to_snippet(self, row: sqlite3.Row) -> Snippet:
+    def _row_to_snippet(self, row: sqlite3.Row | tuple) -> Snippet:
         """Convert a database row to a Snippet object.
 
+        Snippet columns need no conversion, so list queries skip this helper
+        and feed rows straight into the constructor with ``starmap``.
+
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             Snippet object.
         """
-        return Snippet(
-            id=row["id"],
-            book_id=row["book_id"],
-            position=row["position"],
-            content=row["content"],
-            created_at=self._parse_datetime(row["created_at"]),
-        )
-
-    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a datetime string from the database."""
-        if value is None:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace(" ", "T"))
-        except (ValueError, AttributeError):
-            return None
+        return Snippet(*row)
 
 
 class UserProgressRepository:
@@ -652,10 +1103,7 @@ class UserProgressRepository:
         """
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO user_progress (user_id, book_id, current_position, is_completed)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_PROGRESS,
                 (
                     progress.user_id,
                     progress.book_id,
@@ -663,7 +1111,7 @@ class UserProgressRepository:
                     1 if progress.is_completed else 0,
                 ),
             )
-            progress.id = cursor.lastrowid
+            progress.id = cursor.fetchone()[0]
         return progress
 
     def get_by_id(self, progress_id: int) -> Optional[UserProgress]:
@@ -676,9 +1124,7 @@ class UserProgressRepository:
             UserProgress if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM user_progress WHERE id = ?", (progress_id,)
-        )
+        cursor = conn.execute(_SQL_GET_PROGRESS_BY_ID, (progress_id,))
         row = cursor.fetchone()
         return self._row_to_progress(row) if row else None
 
@@ -695,10 +1141,7 @@ class UserProgressRepository:
             UserProgress if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM user_progress WHERE user_id = ? AND book_id = ?",
-            (user_id, book_id),
-        )
+        cursor = conn.execute(_SQL_GET_PROGRESS_BY_USER_AND_BOOK, (user_id, book_id))
         row = cursor.fetchone()
         return self._row_to_progress(row) if row else None
 
@@ -712,11 +1155,27 @@ class UserProgressRepository:
             List of progress records.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM user_progress WHERE user_id = ? ORDER BY updated_at DESC",
-            (user_id,),
-        )
-        return [self._row_to_progress(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_PROGRESS_BY_USER, (user_id,))
+        with validation_disabled():
+            return [self._row_to_progress(row) for row in cursor]
+
+    def get_active(self, user_id: int) -> Optional[UserProgress]:
+        """Retrieve the user's active book progress.
+
+        The active book is the most recently updated one the user has not
+        completed. The lookup is answered from a partial index on
+        uncompleted progress, however many books the user has read.
+
+        Args:
+            user_id: Database ID of the user.
+
+        Returns:
+            UserProgress if the user has an uncompleted book, None otherwise.
+        """
+        conn = self.db.get_connection()
+        cursor = conn.execute(_SQL_GET_ACTIVE_PROGRESS, (user_id,))
+        row = cursor.fetchone()
+        return self._row_to_progress(row) if row else None
 
     def update(self, progress: UserProgress) -> UserProgress:
         """Update an existing progress record.
@@ -737,11 +1196,7 @@ class UserProgressRepository:
                 progress.completed_at.isoformat() if progress.completed_at else None
             )
             conn.execute(
-                """
-                UPDATE user_progress
-                SET current_position = ?, is_completed = ?, completed_at = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_PROGRESS,
                 (
                     progress.current_position,
                     1 if progress.is_completed else 0,
@@ -751,6 +1206,19 @@ class UserProgressRepository:
             )
         return progress
 
+    def touch(self, progress_id: int) -> bool:
+        """Refresh a progress record's updated_at, making its book the active one.
+
+        Args:
+            progress_id: Database ID of the progress record.
+
+        Returns:
+            True if the record was updated, False if not found.
+        """
+        with self.db.transaction() as conn:
+            cursor = conn.execute(_SQL_TOUCH_PROGRESS, (progress_id,))
+            return cursor.rowcount > 0
+
     def delete(self, progress_id: int) -> bool:
         """Delete a progress record by ID.
 
@@ -761,40 +1229,23 @@ class UserProgressRepository:
             True if record was deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM user_progress WHERE id = ?", (progress_id,)
-            )
+            cursor = conn.execute(_SQL_DELETE_PROGRESS, (progress_id,))
             return cursor.rowcount > 0
 
-    def _row_to_progress(self, row: sqlite3.Row) -> UserProgress:
+    def _row_to_progress(self, row: sqlite3.Row | tuple) -> UserProgress:
         """Convert a database row to a UserProgress object.
 
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             UserProgress object.
         """
+        user_id, book_id, current_position, is_completed, *rest = row
         return UserProgress(
-            id=row["id"],
-            user_id=row["user_id"],
-            book_id=row["book_id"],
-            current_position=row["current_position"],
-            is_completed=bool(row["is_completed"]),
-            started_at=self._parse_datetime(row["started_at"]),
-            completed_at=self._parse_datetime(row["completed_at"]),
-            updated_at=self._parse_datetime(row["updated_at"]),
+            user_id, book_id, current_position, bool(is_completed), *rest
         )
 
-    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a datetime string from the database."""
-        if value is None:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace(" ", "T"))
-        except (ValueError, AttributeError):
-            return None
-
     def initialize_progress(self, user_id: int, book_id: int) -> UserProgress:
         """Initialize progress for a user on a book if not already exists.
 
@@ -805,6 +1256,14 @@ class UserProgressRepository:
         Returns:
             UserProgress record (existing or newly created).
         """
+        # Callers usually start a book the user has no progress on yet, so
+        # try the insert first; it returns no row if progress already exists
+        with self.db.transaction() as conn:
+            cursor = conn.execute(_SQL_INSERT_PROGRESS_IF_MISSING, (user_id, book_id))
+            row = cursor.fetchone()
+        if row is not None:
+            return self._row_to_progress(row)
+
         existing = self.get_by_user_and_book(user_id, book_id)
         if existing is not None:
             return existing
@@ -845,21 +1304,17 @@ class DeliveryScheduleRepository:
                 else None
             )
             cursor = conn.execute(
-                """
-                INSERT INTO delivery_schedules
-                    (user_id, book_id, delivery_time, frequency, is_paused, next_delivery_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SCHEDULE,
                 (
                     schedule.user_id,
                     schedule.book_id,
                     schedule.delivery_time,
-                    schedule.frequency.value,
+                    schedule.frequency,
                     1 if schedule.is_paused else 0,
                     next_delivery,
                 ),
             )
-            schedule.id = cursor.lastrowid
+            schedule.id = cursor.fetchone()[0]
         return schedule
 
     def get_by_id(self, schedule_id: int) -> Optional[DeliverySchedule]:
@@ -872,9 +1327,7 @@ class DeliveryScheduleRepository:
             DeliverySchedule if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM delivery_schedules WHERE id = ?", (schedule_id,)
-        )
+        cursor = conn.execute(_SQL_GET_SCHEDULE_BY_ID, (schedule_id,))
         row = cursor.fetchone()
         return self._row_to_schedule(row) if row else None
 
@@ -891,10 +1344,7 @@ class DeliveryScheduleRepository:
             DeliverySchedule if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM delivery_schedules WHERE user_id = ? AND book_id = ?",
-            (user_id, book_id),
-        )
+        cursor = conn.execute(_SQL_GET_SCHEDULE_BY_USER_AND_BOOK, (user_id, book_id))
         row = cursor.fetchone()
         return self._row_to_schedule(row) if row else None
 
@@ -908,11 +1358,9 @@ class DeliveryScheduleRepository:
             List of delivery schedules.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM delivery_schedules WHERE user_id = ? ORDER BY created_at DESC",
-            (user_id,),
-        )
-        return [self._row_to_schedule(row) for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_SCHEDULES_BY_USER, (user_id,))
+        with validation_disabled():
+            return [self._row_to_schedule(row) for row in cursor]
 
     def list_pending_deliveries(self, before: datetime) -> list[DeliverySchedule]:
         """Retrieve schedules with pending deliveries before a given time.
@@ -924,15 +1372,11 @@ class DeliveryScheduleRepository:
             List of schedules ready for delivery.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            """
-            SELECT * FROM delivery_schedules
-            WHERE is_paused = 0 AND next_delivery_at <= ?
-            ORDER BY next_delivery_at ASC
-            """,
-            (before.isoformat(),),
+        cursor = _tuple_cursor(conn).execute(
+            _SQL_LIST_PENDING_SCHEDULES, (before.isoformat(),)
         )
-        return [self._row_to_schedule(row) for row in cursor.fetchall()]
+        with validation_disabled():
+            return [self._row_to_schedule(row) for row in cursor]
 
     def update(self, schedule: DeliverySchedule) -> DeliverySchedule:
         """Update an existing schedule.
@@ -949,34 +1393,61 @@ class DeliveryScheduleRepository:
         if schedule.id is None:
             raise ValueError("Cannot update schedule without ID")
         with self.db.transaction() as conn:
-            last_delivered = (
-                schedule.last_delivered_at.isoformat()
-                if schedule.last_delivered_at
-                else None
-            )
-            next_delivery = (
-                schedule.next_delivery_at.isoformat()
-                if schedule.next_delivery_at
-                else None
-            )
             conn.execute(
-                """
-                UPDATE delivery_schedules
-                SET delivery_time = ?, frequency = ?, is_paused = ?,
-                    last_delivered_at = ?, next_delivery_at = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (
-                    schedule.delivery_time,
-                    schedule.frequency.value,
-                    1 if schedule.is_paused else 0,
-                    last_delivered,
-                    next_delivery,
-                    schedule.id,
-                ),
+                _SQL_UPDATE_SCHEDULE,
+                self._schedule_update_params(schedule),
             )
         return schedule
 
+    def update_many(self, schedules: list[DeliverySchedule]) -> list[DeliverySchedule]:
+        """Update several existing schedules in a single transaction.
+
+        Args:
+            schedules: DeliverySchedule objects with updated fields.
+
+        Returns:
+            The updated schedules.
+
+        Raises:
+            ValueError: If any schedule has no ID.
+        """
+        if any(schedule.id is None for schedule in schedules):
+            raise ValueError("Cannot update schedule without ID")
+        with self.db.transaction() as conn:
+            conn.executemany(
+                _SQL_UPDATE_SCHEDULE,
+                [self._schedule_update_params(schedule) for schedule in schedules],
+            )
+        return schedules
+
+    def _schedule_update_params(
+        self, schedule: DeliverySchedule
+    ) -> tuple[str, str, int, Optional[str], Optional[str], Optional[int]]:
+        """Build the UPDATE parameters for a schedule.
+
+        Args:
+            schedule: DeliverySchedule to serialize.
+
+        Returns:
+            Parameter tuple matching the UPDATE statement.
+        """
+        last_delivered = (
+            schedule.last_delivered_at.isoformat()
+            if schedule.last_delivered_at
+            else None
+        )
+        next_delivery = (
+            schedule.next_delivery_at.isoformat() if schedule.next_delivery_at else None
+        )
+        return (
+            schedule.delivery_time,
+            schedule.frequency,
+            1 if schedule.is_paused else 0,
+            last_delivered,
+            next_delivery,
+            schedule.id,
+        )
+
     def delete(self, schedule_id: int) -> bool:
         """Delete a schedule by ID.
 
@@ -987,46 +1458,35 @@ class DeliveryScheduleRepository:
             True if schedule was deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM delivery_schedules WHERE id = ?", (schedule_id,)
-            )
+            cursor = conn.execute(_SQL_DELETE_SCHEDULE, (schedule_id,))
             return cursor.rowcount > 0
 
-    def _row_to_schedule(self, row: sqlite3.Row) -> DeliverySchedule:
+    def _row_to_schedule(self, row: sqlite3.Row | tuple) -> DeliverySchedule:
         """Convert a database row to a DeliverySchedule object.
 
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             DeliverySchedule object.
         """
+        user_id, book_id, delivery_time, frequency, is_paused, *rest = row
         return DeliverySchedule(
-            id=row["id"],
-            user_id=row["user_id"],
-            book_id=row["book_id"],
-            delivery_time=row["delivery_time"],
-            frequency=Frequency(row["frequency"]),
-            is_paused=bool(row["is_paused"]),
-            last_delivered_at=self._parse_datetime(row["last_delivered_at"]),
-            next_delivery_at=self._parse_datetime(row["next_delivery_at"]),
-            created_at=self._parse_datetime(row["created_at"]),
-            updated_at=self._parse_datetime(row["updated_at"]),
+            user_id,
+            book_id,
+            delivery_time,
+            Frequency(frequency),
+            bool(is_paused),
+            *rest,
         )
 
-    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
-        """Parse a datetime string from the database."""
-        if value is None:
-            return None
-        try:
-            return datetime.fromisoformat(value.replace(" ", "T"))
-        except (ValueError, AttributeError):
-            return None
-
 
 class MigrationManager:
     """Manages database migrations."""
 
+    # Databases whose migrations table has been created by this process
+    _ensured: set[str | Path] = set()
+
     def __init__(self, db_manager: DatabaseConnectionManager) -> None:
         """Initialize the migration manager.
 
@@ -1036,18 +1496,20 @@ class MigrationManager:
         self.db = db_manager
 
     def ensure_migration_table(self) -> None:
-        """Create the migrations tracking table if it doesn't exist."""
+        """Create the migrations tracking table if it doesn't exist.
+
+        The DDL runs at most once per database per process; sqlite3 executes
+        it outside a transaction, so no explicit commit is needed. In-memory
+        databases are never remembered, because every connection to
+        ``:memory:`` opens a separate, empty database.
+        """
+        db_path = self.db.db_path
+        if db_path in MigrationManager._ensured:
+            return
         conn = self.db.get_connection()
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS migrations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-        conn.commit()
+        conn.execute(_SQL_CREATE_MIGRATIONS_TABLE)
+        if str(db_path) != ":memory:":
+            MigrationManager._ensured.add(db_path)
 
     def is_applied(self, migration_name: str) -> bool:
         """Check if a migration has been applied.
@@ -1059,9 +1521,7 @@ class MigrationManager:
             True if migration has been applied.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT 1 FROM migrations WHERE name = ?", (migration_name,)
-        )
+        cursor = conn.execute(_SQL_MIGRATION_APPLIED, (migration_name,))
         return cursor.fetchone() is not None
 
     def mark_applied(self, migration_name: str) -> None:
@@ -1071,10 +1531,7 @@ class MigrationManager:
             migration_name: Name of the migration.
         """
         with self.db.transaction() as conn:
-            conn.execute(
-                "INSERT INTO migrations (name) VALUES (?)",
-                (migration_name,),
-            )
+            conn.execute(_SQL_INSERT_MIGRATION, (migration_name,))
 
     def run_migration(self, migration_name: str, sql: str) -> bool:
         """Run a migration if not already applied.
@@ -1102,8 +1559,8 @@ class MigrationManager:
         """
         self.ensure_migration_table()
         conn = self.db.get_connection()
-        cursor = conn.execute("SELECT name FROM migrations ORDER BY applied_at ASC")
-        return [row["name"] for row in cursor.fetchall()]
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_MIGRATIONS)
+        return [row[0] for row in cursor]
 
 
 class SnippetSummaryRepository:
@@ -1128,11 +1585,7 @@ class SnippetSummaryRepository:
         """
         with self.db.transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO snippet_summaries
-                    (book_id, start_position, end_position, summary_content)
-                VALUES (?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SUMMARY,
                 (
                     summary.book_id,
                     summary.start_position,
@@ -1140,9 +1593,39 @@ class SnippetSummaryRepository:
                     summary.summary_content,
                 ),
             )
-            summary.id = cursor.lastrowid
+            summary.id = cursor.fetchone()[0]
         return summary
 
+    def create_many(self, summaries: list[SnippetSummary]) -> int:
+        """Insert multiple snippet summaries in a single transaction.
+
+        Summaries whose position range already has a row are skipped, so one
+        duplicate cannot roll back the rest of the batch. IDs are not
+        assigned to the passed objects.
+
+        Args:
+            summaries: SnippetSummary objects to insert.
+
+        Returns:
+            Number of summaries inserted.
+        """
+        if not summaries:
+            return 0
+        with self.db.transaction(immediate=True) as conn:
+            cursor = conn.executemany(
+                _SQL_INSERT_SUMMARY_IF_MISSING,
+                [
+                    (
+                        s.book_id,
+                        s.start_position,
+                        s.end_position,
+                        s.summary_content,
+                    )
+                    for s in summaries
+                ],
+            )
+            return cursor.rowcount
+
     def get_by_id(self, summary_id: int) -> Optional[SnippetSummary]:
         """Retrieve a summary by its ID.
 
@@ -1153,9 +1636,7 @@ class SnippetSummaryRepository:
             SnippetSummary if found, None otherwise.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            "SELECT * FROM snippet_summaries WHERE id = ?", (summary_id,)
-        )
+        cursor = conn.execute(_SQL_GET_SUMMARY_BY_ID, (summary_id,))
         row = cursor.fetchone()
         return self._row_to_summary(row) if row else None
 
@@ -1174,11 +1655,7 @@ class SnippetSummaryRepository:
         """
         conn = self.db.get_connection()
         cursor = conn.execute(
-            """
-            SELECT * FROM snippet_summaries
-            WHERE book_id = ? AND start_position = ? AND end_position = ?
-            """,
-            (book_id, start_position, end_position),
+            _SQL_GET_SUMMARY_BY_POSITION, (book_id, start_position, end_position)
         )
         row = cursor.fetchone()
         return self._row_to_summary(row) if row else None
@@ -1193,15 +1670,28 @@ class SnippetSummaryRepository:
             List of SnippetSummary objects ordered by start_position.
         """
         conn = self.db.get_connection()
-        cursor = conn.execute(
-            """
-            SELECT * FROM snippet_summaries
-            WHERE book_id = ?
-            ORDER BY start_position ASC
-            """,
-            (book_id,),
+        cursor = _tuple_cursor(conn).execute(_SQL_LIST_SUMMARIES_BY_BOOK, (book_id,))
+        with validation_disabled():
+            return list(starmap(SnippetSummary, cursor))
+
+    def get_existing_ranges(self, book_id: int) -> set[tuple[int, int]]:
+        """Get the position ranges that already have summaries for a book.
+
+        Reads only the two position columns and answers from the
+        ``(book_id, start_position, end_position)`` index, without loading
+        summary content.
+
+        Args:
+            book_id: Database ID of the book.
+
+        Returns:
+            Set of (start_position, end_position) tuples.
+        """
+        conn = self.db.get_connection()
+        cursor = _tuple_cursor(conn).execute(
+            _SQL_LIST_SUMMARY_RANGES_BY_BOOK, (book_id,)
         )
-        return [self._row_to_summary(row) for row in cursor.fetchall()]
+        return set(cursor)
 
     def delete(self, summary_id: int) -> bool:
         """Delete a summary from the database.
@@ -1213,9 +1703,7 @@ class SnippetSummaryRepository:
             True if deleted, False if not found.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM snippet_summaries WHERE id = ?", (summary_id,)
-            )
+            cursor = conn.execute(_SQL_DELETE_SUMMARY, (summary_id,))
             return cursor.rowcount > 0
 
     def delete_by_book(self, book_id: int) -> int:
@@ -1228,27 +1716,16 @@ class SnippetSummaryRepository:
             Number of summaries deleted.
         """
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM snippet_summaries WHERE book_id = ?", (book_id,)
-            )
+            cursor = conn.execute(_SQL_DELETE_SUMMARIES_BY_BOOK, (book_id,))
             return cursor.rowcount
 
-    def _row_to_summary(self, row: sqlite3.Row) -> SnippetSummary:
+    def _row_to_summary(self, row: sqlite3.Row | tuple) -> SnippetSummary:
         """Convert a database row to a SnippetSummary object.
 
         Args:
-            row: Database row.
+            row: Database row, as a sqlite3.Row or plain tuple.
 
         Returns:
             SnippetSummary object.
         """
-        return SnippetSummary(
-            id=row["id"],
-            book_id=row["book_id"],
-            start_position=row["start_position"],
-            end_position=row["end_position"],
-            summary_content=row["summary_content"],
-            created_at=datetime.fromisoformat(row["created_at"])
-            if row["created_at"]
-            else None,
-        )
+        return SnippetSummary(*row)
@@ -1,6 +1,7 @@
 """Snippet formatter for Telegram message delivery."""
 
 import logging
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -10,25 +11,73 @@ from booktok.models import Book, Snippet, UserProgress
 logger = logging.getLogger(__name__)
 
 
+# Lone surrogates are the only code points that cannot be encoded as UTF-8
+_SURROGATE_TABLE = dict.fromkeys(range(0xD800, 0xE000))
+
+
 def sanitize_text_for_telegram(text: str) -> str:
     """Sanitize text to remove invalid Unicode characters for Telegram.
 
+    ASCII text and text that encodes cleanly are returned as is, so only
+    text that actually contains surrogates is copied.
+
     Args:
         text: The text to sanitize.
 
     Returns:
         Sanitized text safe for Telegram messages.
     """
-    # Remove surrogate pairs and other invalid Unicode
-    return text.encode("utf-8", errors="ignore").decode("utf-8", errors="ignore")
+    if text.isascii():
+        return text
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Remove surrogate pairs and other invalid Unicode
+        return text.translate(_SURROGATE_TABLE)
+    return text
 
 
 TELEGRAM_MAX_MESSAGE_LENGTH = 4096
 HEADER_RESERVE = 200
 SAFE_CONTENT_LENGTH = TELEGRAM_MAX_MESSAGE_LENGTH - HEADER_RESERVE
 
+# Characters that must be backslash-escaped in Telegram Markdown
+_MD_ESCAPE_RE = re.compile(r"[_*\[\]()~`>#+\-=|{}.!]")
+
+# Sentence endings _find_split_point prefers to split after
+_SENTENCE_ENDS = (". ", "! ", "? ")
+
+# ASCII whitespace, other than space and newline, that str.split() breaks on
+_OTHER_ASCII_WHITESPACE = "\t\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def _is_normalized(content: str) -> bool:
+    """Check whether content is already in the shape _format_content produces.
+
+    That is single spaces between words, paragraphs separated by exactly
+    one blank line and no surrounding whitespace. Non-ASCII text is
+    reported as not normalized rather than scanned for Unicode spaces.
 
-@dataclass
+    Args:
+        content: Snippet content to check.
+
+    Returns:
+        True if formatting would return the content unchanged.
+    """
+    return (
+        content.isascii()
+        and not content[:1].isspace()
+        and not content[-1:].isspace()
+        and "  " not in content
+        and "\n\n\n" not in content
+        and " \n" not in content
+        and "\n " not in content
+        and content.count("\n") == 2 * content.count("\n\n")
+        and not any(c in content for c in _OTHER_ASCII_WHITESPACE)
+    )
+
+
+@dataclass(slots=True)
 class FormattedMessage:
     """A formatted message ready for Telegram delivery."""
 
@@ -44,7 +93,7 @@ class FormattedMessage:
         return len(self.text) <= TELEGRAM_MAX_MESSAGE_LENGTH
 
 
-@dataclass
+@dataclass(slots=True)
 class FormattedSnippet:
     """Result of formatting a snippet for Telegram delivery."""
 
@@ -81,6 +130,7 @@ class SnippetFormatter:
         self.total_snippets = (
             total_snippets if total_snippets is not None else book.total_snippets
         )
+        self._header_prefix = self._build_header_prefix()
 
     def format_snippet(
         self,
@@ -121,14 +171,14 @@ class SnippetFormatter:
             total_snippets=self.total_snippets,
         )
 
-    def _build_header(self, current_position: int) -> str:
-        """Build the message header with book info and progress.
+    def _build_header_prefix(self) -> str:
+        """Build the book title and author lines of the message header.
 
-        Args:
-            current_position: Current snippet position (1-indexed).
+        These do not change between snippets, so they are built once per
+        formatter.
 
         Returns:
-            Formatted header string.
+            Header lines identifying the book.
         """
         parts: list[str] = []
 
@@ -140,11 +190,22 @@ class SnippetFormatter:
             safe_author = sanitize_text_for_telegram(self.book.author)
             parts.append(f"✍️ {self._escape_markdown(safe_author)}")
 
-        progress = f"📖 {current_position}/{self.total_snippets} snippets"
-        parts.append(progress)
-
         return "\n".join(parts)
 
+    def _build_header(self, current_position: int) -> str:
+        """Build the message header with book info and progress.
+
+        Args:
+            current_position: Current snippet position (1-indexed).
+
+        Returns:
+            Formatted header string.
+        """
+        return (
+            f"{self._header_prefix}\n"
+            f"📖 {current_position}/{self.total_snippets} snippets"
+        )
+
     def _format_content(self, content: str) -> str:
         """Format snippet content with proper paragraph breaks.
 
@@ -154,6 +215,9 @@ class SnippetFormatter:
         Returns:
             Formatted content with proper spacing.
         """
+        if _is_normalized(content):
+            return content
+
         paragraphs = content.split("\n\n")
         formatted_paragraphs: list[str] = []
 
@@ -217,52 +281,61 @@ class SnippetFormatter:
         if len(content) <= first_length:
             return [content]
 
+        # Walk an offset through the original string rather than re-slicing
+        # the remainder, so each character is copied once.
         chunks: list[str] = []
-        remaining = content
+        offset = 0
+        content_length = len(content)
         max_length = first_length
 
-        while remaining:
-            if len(remaining) <= max_length:
-                chunks.append(remaining)
+        while offset < content_length:
+            if content_length - offset <= max_length:
+                chunks.append(content[offset:])
                 break
 
-            split_point = self._find_split_point(remaining, max_length)
-            chunks.append(remaining[:split_point].rstrip())
-            remaining = remaining[split_point:].lstrip()
+            split_point = self._find_split_point(content, offset, max_length)
+            chunks.append(content[offset:split_point].rstrip())
+            offset = split_point
+            while offset < content_length and content[offset].isspace():
+                offset += 1
 
             max_length = subsequent_length
 
         return chunks
 
-    def _find_split_point(self, text: str, max_length: int) -> int:
+    def _find_split_point(self, text: str, start: int, max_length: int) -> int:
         """Find the best point to split text (at paragraph or sentence boundary).
 
         Args:
             text: Text to analyze.
+            start: Index where the current chunk begins.
             max_length: Maximum length for the chunk.
 
         Returns:
-            Index at which to split.
+            Absolute index in text at which to split.
         """
-        para_break = text.rfind("\n\n", 0, max_length)
-        if para_break > max_length // 2:
+        end = start + max_length
+        # Breaks in the first half of the chunk are not used, so searches
+        # only cover the second half
+        midpoint = start + max_length // 2
+        search_start = midpoint + 1
+
+        para_break = text.rfind("\n\n", search_start, end)
+        if para_break != -1:
             return para_break + 2
 
-        sentence_ends = [". ", "! ", "? "]
-        best_sentence = -1
-        for end in sentence_ends:
-            pos = text.rfind(end, 0, max_length)
-            if pos > best_sentence:
-                best_sentence = pos
-
-        if best_sentence > max_length // 2:
+        best_sentence = max(
+            text.rfind(sentence_end, search_start, end)
+            for sentence_end in _SENTENCE_ENDS
+        )
+        if best_sentence != -1:
             return best_sentence + 2
 
-        space = text.rfind(" ", 0, max_length)
-        if space > 0:
+        space = text.rfind(" ", start, end)
+        if space > start:
             return space + 1
 
-        return max_length
+        return end
 
     def _escape_markdown(self, text: str) -> str:
         """Escape special Markdown characters for Telegram.
@@ -273,30 +346,7 @@ class SnippetFormatter:
         Returns:
             Escaped text safe for Telegram Markdown.
         """
-        special_chars = [
-            "_",
-            "*",
-            "[",
-            "]",
-            "(",
-            ")",
-            "~",
-            "`",
-            ">",
-            "#",
-            "+",
-            "-",
-            "=",
-            "|",
-            "{",
-            "}",
-            ".",
-            "!",
-        ]
-        result = text
-        for char in special_chars:
-            result = result.replace(char, f"\\{char}")
-        return result
+        return _MD_ESCAPE_RE.sub(r"\\\g<0>", text)
 
 
 def validate_message_length(message: str) -> bool:
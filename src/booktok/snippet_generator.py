@@ -5,9 +5,6 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-import nltk
-from nltk.tokenize import sent_tokenize
-
 from booktok.models import Book, Snippet
 
 
@@ -17,8 +14,10 @@ MIN_SNIPPET_LENGTH = 100
 MAX_SNIPPET_LENGTH = 3500
 TARGET_SNIPPET_LENGTH = 800
 
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
 
-@dataclass
+@dataclass(slots=True)
 class SnippetGenerationResult:
     """Result of snippet generation with metadata."""
 
@@ -47,9 +46,7 @@ class SnippetGenerationError(Exception):
 
 
 class SnippetGenerator:
-    """Generates learning snippets from extracted book text using NLTK."""
-
-    _nltk_initialized: bool = False
+    """Generates learning snippets from extracted book text."""
 
     def __init__(self, book: Book) -> None:
         """Initialize the snippet generator.
@@ -63,21 +60,9 @@ class SnippetGenerator:
         if book.id is None:
             raise ValueError("Book must have an ID to generate snippets")
         self.book = book
-        self._ensure_nltk_data()
-
-    @classmethod
-    def _ensure_nltk_data(cls) -> None:
-        """Ensure NLTK punkt tokenizer data is available."""
-        if cls._nltk_initialized:
-            return
-
-        try:
-            nltk.data.find("tokenizers/punkt_tab")
-        except LookupError:
-            logger.info("Downloading NLTK punkt_tab tokenizer data...")
-            nltk.download("punkt_tab", quiet=True)
-
-        cls._nltk_initialized = True
+        # Paragraphs of the last text split, so estimating and then
+        # generating from the same text only splits it once
+        self._paragraph_cache: Optional[tuple[str, list[str]]] = None
 
     def generate_snippets(self, text: str) -> list[Snippet]:
         """Generate snippets from extracted book text.
@@ -160,13 +145,20 @@ class SnippetGenerator:
     def _split_into_paragraphs(self, text: str) -> list[str]:
         """Split text into paragraphs using double newlines as boundaries.
 
+        The result for the most recent text is reused when the same string
+        object is passed again.
+
         Args:
             text: The text to split.
 
         Returns:
             List of paragraph strings.
         """
-        raw_paragraphs = re.split(r"\n\s*\n", text)
+        cached = self._paragraph_cache
+        if cached is not None and cached[0] is text:
+            return cached[1]
+
+        raw_paragraphs = _PARAGRAPH_BREAK_RE.split(text)
 
         paragraphs: list[str] = []
         for para in raw_paragraphs:
@@ -174,13 +166,15 @@ class SnippetGenerator:
             if cleaned and len(cleaned) >= 20:
                 paragraphs.append(cleaned)
 
+        self._paragraph_cache = (text, paragraphs)
         return paragraphs
 
     def _create_snippets_from_paragraphs(self, paragraphs: list[str]) -> list[Snippet]:
         """Create snippets by grouping 1-2 paragraphs together.
 
-        Uses NLTK sentence tokenization to validate paragraph structure
-        and ensure proper text boundaries.
+        Paragraphs are walked once. A paragraph shorter than the target
+        length is held back so it can be paired with the next one, as long
+        as the pair fits within the maximum snippet length.
 
         Args:
             paragraphs: List of paragraph strings.
@@ -189,59 +183,48 @@ class SnippetGenerator:
             List of Snippet objects with sequential positions.
         """
         snippets: list[Snippet] = []
-        position = 0
-        i = 0
-
-        while i < len(paragraphs):
-            current_para = paragraphs[i]
-            snippet_text = current_para
-
-            if (
-                i + 1 < len(paragraphs)
-                and len(snippet_text) < TARGET_SNIPPET_LENGTH
-            ):
-                next_para = paragraphs[i + 1]
-                combined = snippet_text + "\n\n" + next_para
-
-                if len(combined) <= MAX_SNIPPET_LENGTH:
-                    snippet_text = combined
-                    i += 1
-
-            snippet_text = self._ensure_complete_sentences(snippet_text)
-
-            if len(snippet_text) >= MIN_SNIPPET_LENGTH:
-                assert self.book.id is not None
-                snippet = Snippet(
-                    book_id=self.book.id,
-                    position=position,
-                    content=snippet_text,
-                )
-                snippets.append(snippet)
-                position += 1
-
-            i += 1
+        pending: Optional[str] = None
 
-        return snippets
+        for para in paragraphs:
+            if pending is not None:
+                if len(pending) + 2 + len(para) <= MAX_SNIPPET_LENGTH:
+                    self._append_snippet(snippets, f"{pending}\n\n{para}")
+                    pending = None
+                    continue
+                self._append_snippet(snippets, pending)
+                pending = None
 
-    def _ensure_complete_sentences(self, text: str) -> str:
-        """Ensure the text ends with a complete sentence.
+            if len(para) < TARGET_SNIPPET_LENGTH:
+                pending = para
+            else:
+                self._append_snippet(snippets, para)
 
-        Uses NLTK sentence tokenization to detect sentence boundaries.
+        if pending is not None:
+            self._append_snippet(snippets, pending)
 
-        Args:
-            text: The text to process.
+        return snippets
 
-        Returns:
-            Text that ends with a complete sentence.
-        """
-        sentences = sent_tokenize(text)
+    def _append_snippet(self, snippets: list[Snippet], text: str) -> None:
+        """Append a snippet for text if it is long enough once trimmed.
 
-        if not sentences:
-            return text
+        The snippet takes the next sequential position.
 
-        reconstructed = " ".join(sentences)
+        Args:
+            snippets: Snippets created so far.
+            text: Text of the candidate snippet.
+        """
+        snippet_text = text.strip()
+        if len(snippet_text) < MIN_SNIPPET_LENGTH:
+            return
 
-        return reconstructed.strip()
+        assert self.book.id is not None
+        snippets.append(
+            Snippet(
+                book_id=self.book.id,
+                position=len(snippets),
+                content=snippet_text,
+            )
+        )
 
     def get_estimated_snippet_count(self, text: str) -> int:
         """Estimate the number of snippets that will be generated.
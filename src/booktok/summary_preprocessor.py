@@ -16,6 +16,12 @@ from booktok.repository import (
 
 logger = logging.getLogger(__name__)
 
+# Generated summaries are written in batches of this size
+SUMMARY_FLUSH_SIZE = 10
+
+# A range ready to summarize: start, end, snippet contents, previous snippet
+_RangeContent = tuple[int, int, list[str], Optional[str]]
+
 
 class SummaryPreprocessor:
     """Handles background pre-processing of book summaries."""
@@ -25,6 +31,7 @@ class SummaryPreprocessor:
         db_manager: DatabaseConnectionManager,
         ai_summarizer: AISummarizer,
         summary_page_count: int,
+        max_concurrency: int = 4,
     ) -> None:
         """Initialize the summary preprocessor.
 
@@ -32,10 +39,12 @@ class SummaryPreprocessor:
             db_manager: Database connection manager.
             ai_summarizer: AI summarizer instance.
             summary_page_count: Number of snippets per summary.
+            max_concurrency: Maximum number of summary requests in flight.
         """
         self.db_manager = db_manager
         self.ai_summarizer = ai_summarizer
         self.summary_page_count = summary_page_count
+        self.max_concurrency = max(1, max_concurrency)
 
         self.book_repo = BookRepository(db_manager)
         self.snippet_repo = SnippetRepository(db_manager)
@@ -44,6 +53,13 @@ class SummaryPreprocessor:
     async def preprocess_book(self, book_id: int) -> int:
         """Pre-process all summaries for a book.
 
+        Missing ranges flow through a three-stage pipeline: a producer
+        reads each range's snippets, up to ``max_concurrency`` workers send
+        them to the summarizer, and a single writer saves the results in
+        batches. The stages are linked by queues, so reading the next
+        ranges and writing finished summaries overlap with the requests in
+        flight.
+
         Args:
             book_id: Database ID of the book.
 
@@ -60,60 +76,93 @@ class SummaryPreprocessor:
             logger.info(f"Book {book_id} has no snippets, skipping")
             return 0
 
+        missing_ranges = self.get_missing_summary_positions(book_id)
+        if not missing_ranges:
+            logger.debug(f"All summaries already exist for book {book_id}")
+            return 0
+
         logger.info(
             f"Starting summary pre-processing for book '{book.title}' "
-            f"({total_snippets} snippets, {self.summary_page_count} per summary)"
+            f"({total_snippets} snippets, {self.summary_page_count} per summary, "
+            f"{len(missing_ranges)} to generate)"
         )
 
+        worker_count = min(self.max_concurrency, len(missing_ranges))
+        # None tells the next stage that no more items will arrive
+        fetch_queue: asyncio.Queue[Optional[_RangeContent]] = asyncio.Queue(
+            maxsize=worker_count * 2
+        )
+        write_queue: asyncio.Queue[Optional[SnippetSummary]] = asyncio.Queue()
         summaries_generated = 0
-        position = 0
-
-        while position < total_snippets:
-            start_pos = position
-            end_pos = min(position + self.summary_page_count - 1, total_snippets - 1)
-
-            # Check if summary already exists
-            existing = self.summary_repo.get_by_position(book_id, start_pos, end_pos)
-            if existing is not None:
-                logger.debug(
-                    f"Summary already exists for book {book_id} positions {start_pos}-{end_pos}"
-                )
-                position += self.summary_page_count
-                continue
-
-            # Generate the summary
-            try:
-                summary_content = await self._generate_summary(
-                    book_id, start_pos, end_pos
-                )
 
-                if summary_content:
-                    # Save to database
-                    summary = SnippetSummary(
+        async def produce() -> None:
+            for start_pos, end_pos in missing_ranges:
+                try:
+                    contents, previous_snippet = self._fetch_range(
+                        book_id, start_pos, end_pos
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Error reading snippets for book {book_id} "
+                        f"positions {start_pos}-{end_pos}: {e}",
+                        exc_info=True,
+                    )
+                    continue
+                if contents:
+                    await fetch_queue.put(
+                        (start_pos, end_pos, contents, previous_snippet)
+                    )
+            for _ in range(worker_count):
+                await fetch_queue.put(None)
+
+        async def summarize() -> None:
+            while (item := await fetch_queue.get()) is not None:
+                start_pos, end_pos, contents, previous_snippet = item
+                summary_content = await self._summarize(contents, previous_snippet)
+                if not summary_content:
+                    logger.warning(
+                        f"Failed to generate summary for book {book_id} "
+                        f"positions {start_pos}-{end_pos}"
+                    )
+                    continue
+                await write_queue.put(
+                    SnippetSummary(
                         book_id=book_id,
                         start_position=start_pos,
                         end_position=end_pos,
                         summary_content=summary_content,
                     )
-                    self.summary_repo.create(summary)
+                )
+
+        async def summarize_all() -> None:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(worker_count):
+                    group.create_task(summarize())
+            await write_queue.put(None)
+
+        async def write() -> None:
+            nonlocal summaries_generated
+            pending: list[SnippetSummary] = []
+            try:
+                while (summary := await write_queue.get()) is not None:
+                    pending.append(summary)
                     summaries_generated += 1
                     logger.info(
-                        f"Generated summary {summaries_generated} for book '{book.title}' "
-                        f"positions {start_pos}-{end_pos}"
+                        f"Generated summary {summaries_generated} for book "
+                        f"'{book.title}' positions "
+                        f"{summary.start_position}-{summary.end_position}"
                     )
-                else:
-                    logger.warning(
-                        f"Failed to generate summary for book {book_id} "
-                        f"positions {start_pos}-{end_pos}"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"Error generating summary for book {book_id} "
-                    f"positions {start_pos}-{end_pos}: {e}",
-                    exc_info=True,
-                )
+                    if len(pending) >= SUMMARY_FLUSH_SIZE:
+                        batch, pending = pending, []
+                        self._save_summaries(book_id, batch)
+            finally:
+                # Save what was generated even if the run is cancelled
+                self._save_summaries(book_id, pending)
 
-            position += self.summary_page_count
+        async with asyncio.TaskGroup() as group:
+            group.create_task(summarize_all())
+            group.create_task(write())
 
         logger.info(
             f"Completed pre-processing for book '{book.title}': "
@@ -121,10 +170,28 @@ class SummaryPreprocessor:
         )
         return summaries_generated
 
-    async def _generate_summary(
+    def _save_summaries(self, book_id: int, summaries: list[SnippetSummary]) -> None:
+        """Save a batch of generated summaries, logging rather than raising.
+
+        A failed batch is not retried, so one database error costs only
+        the summaries in that batch, and the remaining ranges still run.
+
+        Args:
+            book_id: Database ID of the book.
+            summaries: Summaries to save.
+        """
+        try:
+            self.summary_repo.create_many(summaries)
+        except Exception as e:
+            logger.error(
+                f"Error saving {len(summaries)} summaries for book {book_id}: {e}",
+                exc_info=True,
+            )
+
+    def _fetch_range(
         self, book_id: int, start_pos: int, end_pos: int
-    ) -> Optional[str]:
-        """Generate a summary for a range of snippets.
+    ) -> tuple[list[str], Optional[str]]:
+        """Read the snippet text needed to summarize a range.
 
         Args:
             book_id: Database ID of the book.
@@ -132,29 +199,38 @@ class SummaryPreprocessor:
             end_pos: Ending position.
 
         Returns:
-            Generated summary content, or None on failure.
+            Tuple of the range's snippet contents and the content of the
+            snippet just before it, if any.
         """
-        # Fetch the snippets
-        snippets = self.snippet_repo.get_range_by_book(book_id, start_pos, end_pos)
-
-        if not snippets:
-            return None
+        contents = self.snippet_repo.get_contents_in_range(book_id, start_pos, end_pos)
 
         # Get previous snippet for context
         previous_snippet = None
-        if start_pos > 0:
+        if contents and start_pos > 0:
             prev_obj = self.snippet_repo.get_by_book_and_position(
                 book_id, start_pos - 1
             )
             if prev_obj:
                 previous_snippet = prev_obj.content
 
-        # Generate summary
+        return contents, previous_snippet
+
+    async def _summarize(
+        self, contents: list[str], previous_snippet: Optional[str]
+    ) -> Optional[str]:
+        """Generate a summary for a range of snippets.
+
+        Args:
+            contents: Snippet contents to summarize.
+            previous_snippet: Content of the preceding snippet for context.
+
+        Returns:
+            Generated summary content, or None on failure.
+        """
         try:
-            summary = await self.ai_summarizer.summarize_snippets(
-                [s.content for s in snippets], previous_snippet
+            return await self.ai_summarizer.summarize_snippets(
+                contents, previous_snippet
             )
-            return summary
         except Exception as e:
             logger.error(f"Error calling AI summarizer: {e}", exc_info=True)
             return None
@@ -167,20 +243,12 @@ class SummaryPreprocessor:
 
         Returns:
             List of (start_position, end_position) tuples.
-
-        Note:
-            Current implementation loads all summaries into memory.
-            For books with thousands of summaries, this could be optimized
-            with a database query to find gaps directly.
         """
         total_snippets = self.snippet_repo.count_by_book(book_id)
         if total_snippets == 0:
             return []
 
-        existing_summaries = self.summary_repo.list_by_book(book_id)
-        existing_ranges = {
-            (s.start_position, s.end_position) for s in existing_summaries
-        }
+        existing_ranges = self.summary_repo.get_existing_ranges(book_id)
 
         missing_ranges = []
         position = 0
@@ -205,6 +273,7 @@ class SummaryPreprocessorRunner:
         db_manager: DatabaseConnectionManager,
         openrouter_config: OpenRouterConfig,
         check_interval_seconds: int = 300,
+        ai_summarizer: Optional[AISummarizer] = None,
     ) -> None:
         """Initialize the preprocessor runner.
 
@@ -212,10 +281,15 @@ class SummaryPreprocessorRunner:
             db_manager: Database connection manager.
             openrouter_config: OpenRouter configuration.
             check_interval_seconds: How often to check for books needing processing.
+            ai_summarizer: Summarizer to share with the rest of the application.
+                If None, the runner creates its own on start and closes it on
+                stop.
         """
         self.db_manager = db_manager
         self.openrouter_config = openrouter_config
         self.check_interval = check_interval_seconds
+        self.ai_summarizer = ai_summarizer
+        self._owns_summarizer = ai_summarizer is None
 
         self.book_repo = BookRepository(db_manager)
         self.snippet_repo = SnippetRepository(db_manager)
@@ -232,11 +306,13 @@ class SummaryPreprocessorRunner:
             return
 
         # Initialize AI summarizer and preprocessor
-        ai_summarizer = AISummarizer(self.openrouter_config)
+        if self.ai_summarizer is None:
+            self.ai_summarizer = AISummarizer(self.openrouter_config)
         self._preprocessor = SummaryPreprocessor(
             self.db_manager,
-            ai_summarizer,
+            self.ai_summarizer,
             self.openrouter_config.summary_page_count,
+            self.openrouter_config.summary_concurrency,
         )
 
         self._running = True
@@ -255,6 +331,9 @@ class SummaryPreprocessorRunner:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._owns_summarizer and self.ai_summarizer is not None:
+            await self.ai_summarizer.close()
+            self.ai_summarizer = None
         logger.info("Stopped summary preprocessor runner")
 
     def is_running(self) -> bool:
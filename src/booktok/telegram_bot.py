@@ -1,13 +1,24 @@
 """Telegram bot interface with command handlers."""
 
+import asyncio
+import functools
 import logging
+import multiprocessing
+import re
+import time
+from collections.abc import Awaitable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional
+from difflib import get_close_matches
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
 
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Message, Update
 from telegram.error import BadRequest, NetworkError, TelegramError
 from telegram.ext import (
     Application,
+    BaseUpdateProcessor,
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
@@ -17,11 +28,11 @@ from telegram.ext import (
 
 from bs4 import BeautifulSoup
 
-from booktok.book_processor import BookProcessor
-from booktok.book_scanner import BookScanner
+from booktok.book_processor import BookProcessor, ProcessingResult
+from booktok.book_scanner import BookFile, BookScanner
 from booktok.config import AppConfig
 from booktok.delivery_scheduler import DeliveryScheduler
-from booktok.models import Book, BookStatus, User, UserProgress
+from booktok.models import Book, BookStatus, Snippet, User, UserProgress
 from booktok.snippet_generator import SnippetGenerator
 from booktok.repository import (
     BookRepository,
@@ -97,8 +108,6 @@ def clean_html_for_telegram(text: str) -> str:
     cleaned_text = str(soup)
 
     # Fix multiple newlines (more than 2)
-    import re
-
     cleaned_text = re.sub(r"\n{3,}", "\n\n", cleaned_text)
 
     return cleaned_text.strip()
@@ -177,8 +186,302 @@ I didn't understand that command.
 Tip: Commands always start with a forward slash (/)"""
 
 
+PLAIN_TEXT_MESSAGE = """I can only respond to commands right now.
+
+Try /help to see the list of available commands!"""
+
+
+SUGGESTION_MESSAGE_TEMPLATE = """❓ *Did you mean {suggestion}?*
+
+Your message: `{user_input}`
+
+Try using *{suggestion}* instead.
+
+Use /help to see all available commands."""
+
+
 VALID_COMMANDS = ["start", "help", "books", "next", "pause", "resume", "schedule"]
 
+_VALID_COMMAND_SET = frozenset(VALID_COMMANDS)
+
+# Valid commands by their first two letters, which are unique among them,
+# used to suggest the closest command for a mistyped one
+_COMMAND_BY_PREFIX = {command[:2]: command for command in VALID_COMMANDS}
+
+# Words commonly sent instead of a command, checked in order as substrings
+_COMMON_MISTAKES = (
+    ("begin", "/start"),
+    ("starts", "/start"),
+    ("starting", "/start"),
+    ("hi", "/start"),
+    ("hello", "/start"),
+    ("hey", "/start"),
+    ("helps", "/help"),
+    ("helping", "/help"),
+    ("?", "/help"),
+    ("commands", "/help"),
+    ("menu", "/help"),
+    ("nexts", "/next"),
+    ("continue", "/next"),
+    ("more", "/next"),
+    ("read", "/next"),
+    ("snippet", "/next"),
+    ("stop", "/pause"),
+    ("paused", "/pause"),
+    ("halt", "/pause"),
+    ("unpause", "/resume"),
+    ("restart", "/resume"),
+    ("resumed", "/resume"),
+)
+
+# All the words as one alternation, so text containing none of them, the
+# usual case, is rejected in a single scan
+_COMMON_MISTAKE_RE = re.compile("|".join(re.escape(key) for key, _ in _COMMON_MISTAKES))
+
+# Suggestions for a mistyped command by the command or common word it is
+# closest to, so "/halp" suggests /help and "/sttop" suggests /pause
+_SUGGESTION_BY_WORD = {
+    **dict(_COMMON_MISTAKES),
+    **{command: f"/{command}" for command in VALID_COMMANDS},
+}
+_FUZZY_MATCH_CUTOFF = 0.7
+# difflib's ratio for a name of length n against a word of length m is at
+# most 2 * m / (n + m), so names longer than this never reach the cutoff
+_FUZZY_MAX_NAME_LENGTH = int(
+    max(map(len, _SUGGESTION_BY_WORD)) * (2 / _FUZZY_MATCH_CUTOFF - 1)
+)
+# Every word is made of ASCII letters, so a name without any cannot match
+_ASCII_LETTER_RE = re.compile("[a-z]")
+
+# Worker processes used to extract text and generate snippets for new books
+BOOK_PROCESSING_WORKERS = 2
+
+# Updates handled at the same time across all chats
+MAX_CONCURRENT_UPDATES = 32
+
+# How long the directory scan shown by /books is reused for book selection
+BOOK_SCAN_CACHE_TTL_SECONDS = 300
+_BOOK_SCAN_CACHE_KEY = "book_scan"
+
+# Callback data prefixes of the /books buttons
+_NEW_BOOK_CALLBACK_PREFIX = "select_new_book:"
+_EXISTING_BOOK_CALLBACK_PREFIX = "select_existing_book:"
+
+
+@functools.lru_cache(maxsize=1024)
+def _suggest_command(user_input: str) -> Optional[str]:
+    """Find the command to suggest for an unrecognized message.
+
+    Users tend to repeat the same few mistakes, so results are cached by
+    the raw text and repeats skip normalizing it as well.
+
+    Args:
+        user_input: Message text as sent.
+
+    Returns:
+        Command to suggest, such as "/start", or None if nothing fits.
+    """
+    user_input_lower = user_input.lower().strip()
+    if _COMMON_MISTAKE_RE.search(user_input_lower):
+        # The regex stops at the leftmost word, but the table order decides
+        # which suggestion wins when several words appear
+        return next(
+            suggestion
+            for key, suggestion in _COMMON_MISTAKES
+            if key in user_input_lower
+        )
+    if not user_input_lower.startswith("/"):
+        return None
+
+    # Otherwise suggest the closest command or word, or failing that the
+    # command that starts the same way
+    command_name = _get_command_name(user_input_lower)
+    if len(command_name) <= _FUZZY_MAX_NAME_LENGTH and _ASCII_LETTER_RE.search(
+        command_name
+    ):
+        close_matches = get_close_matches(
+            command_name, _SUGGESTION_BY_WORD, n=1, cutoff=_FUZZY_MATCH_CUTOFF
+        )
+        if close_matches:
+            return _SUGGESTION_BY_WORD[close_matches[0]]
+    command = _COMMAND_BY_PREFIX.get(command_name[:2])
+    return f"/{command}" if command is not None else None
+
+
+def _get_command_name(text: str) -> str:
+    """Get the lowercase command name from a message starting with a slash.
+
+    Args:
+        text: Message text, including the leading slash.
+
+    Returns:
+        First word without the slash and any @BotName suffix.
+    """
+    words = text[1:].split(maxsplit=1)
+    return words[0].partition("@")[0].lower() if words else ""
+
+
+class _UnrecognizedCommandFilter(filters.MessageFilter):
+    """Matches messages whose leading /command is not one the bot handles."""
+
+    __slots__ = ()
+
+    def filter(self, message: Message) -> bool:
+        """Check the command name against the known commands.
+
+        The name is the first word without its leading slash and any
+        @BotName suffix, so /start@BotName counts as /start while
+        /startfoo does not.
+
+        Args:
+            message: Incoming Telegram message.
+
+        Returns:
+            True if the message starts with an unknown command.
+        """
+        text = message.text
+        if not text or not text.startswith("/"):
+            return False
+        return _get_command_name(text) not in _VALID_COMMAND_SET
+
+
+_UNRECOGNIZED_COMMAND_FILTER = _UnrecognizedCommandFilter()
+
+
+class _PerChatUpdateProcessor(BaseUpdateProcessor):
+    """Handles updates from different chats concurrently.
+
+    Updates from the same chat still run one at a time and in the order
+    they arrived, so a user's commands never interleave, while one chat
+    waiting on book processing or a summary does not hold up the others.
+
+    The concurrency limit is only taken once an update holds its chat's
+    lock, so updates queued behind a busy chat do not use up the slots
+    other chats need, which is why process_update skips the base class
+    semaphore.
+    """
+
+    __slots__ = ("_active_updates", "_chat_locks", "_chat_pending", "_update_slots")
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        """Initialize the processor.
+
+        Args:
+            max_concurrent_updates: Maximum number of updates handled at
+                the same time across all chats.
+        """
+        super().__init__(max_concurrent_updates)
+        self._update_slots = asyncio.Semaphore(max_concurrent_updates)
+        self._active_updates = 0
+        self._chat_locks: dict[int, asyncio.Lock] = {}
+        # Updates holding or waiting for each chat's lock, so the lock can
+        # be dropped once the chat goes quiet
+        self._chat_pending: dict[int, int] = {}
+
+    @property
+    def current_concurrent_updates(self) -> int:
+        """Number of updates currently running their handlers."""
+        return self._active_updates
+
+    async def process_update(  # type: ignore[misc]
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Process an update without taking a concurrency slot up front.
+
+        Args:
+            update: Incoming update.
+            coroutine: Coroutine running the handlers for the update.
+        """
+        await self.do_process_update(update, coroutine)
+
+    async def _run_in_slot(self, coroutine: Awaitable[Any]) -> None:
+        """Run an update's handlers once a concurrency slot is free.
+
+        Args:
+            coroutine: Coroutine running the handlers for the update.
+        """
+        async with self._update_slots:
+            self._active_updates += 1
+            try:
+                await coroutine
+            finally:
+                self._active_updates -= 1
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Run the handlers for an update once its chat is free.
+
+        Args:
+            update: Incoming update.
+            coroutine: Coroutine running the handlers for the update.
+        """
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            await self._run_in_slot(coroutine)
+            return
+
+        chat_id = chat.id
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        self._chat_pending[chat_id] = self._chat_pending.get(chat_id, 0) + 1
+        try:
+            async with lock:
+                await self._run_in_slot(coroutine)
+        finally:
+            pending = self._chat_pending[chat_id] - 1
+            if pending:
+                self._chat_pending[chat_id] = pending
+            else:
+                del self._chat_pending[chat_id]
+                del self._chat_locks[chat_id]
+
+    async def initialize(self) -> None:
+        """Nothing to set up; locks are created per chat on demand."""
+
+    async def shutdown(self) -> None:
+        """Nothing to release; locks are dropped as chats go quiet."""
+
+
+async def _reply_markdown_or_plain(message: Message, text: str, kind: str) -> None:
+    """Reply with Markdown, falling back to plain text if Telegram rejects it.
+
+    Args:
+        message: Message to reply to.
+        text: Reply text, formatted as Markdown.
+        kind: What is being sent, used in the fallback warning.
+    """
+    try:
+        await message.reply_text(text, parse_mode="Markdown")
+    except BadRequest as e:
+        logger.warning(
+            f"Failed to send {kind} with Markdown: {e}. Retrying without formatting."
+        )
+        await message.reply_text(text, parse_mode=None)
+
+
+def _extract_snippets(book: Book) -> tuple[ProcessingResult, list[Snippet]]:
+    """Extract a book's text and split it into snippets.
+
+    Runs in a worker process, so the extracted text is dropped from the
+    result before it is sent back; only the snippets are needed.
+
+    Args:
+        book: The book to process.
+
+    Returns:
+        Tuple of the processing result and the generated snippets, which
+        is empty if processing failed.
+    """
+    result = BookProcessor(book).process_book_safely()
+    if not result.success or result.text is None:
+        return result, []
+
+    snippets = SnippetGenerator(book).generate_snippets(result.text)
+    result.text = None
+    return result, snippets
+
 
 class TelegramBotInterface:
     """Interface for handling Telegram bot commands and interactions."""
@@ -210,18 +513,68 @@ class TelegramBotInterface:
         self.scheduler = DeliveryScheduler(db_manager)
         self.application: Optional[Application] = None  # type: ignore[type-arg]
 
+        # One lock per book file path, held while the book is looked up and
+        # processed, so two chats picking the same new book do not both
+        # create and process it
+        self._book_file_locks: dict[str, asyncio.Lock] = {}
+
+        # Last /books reply and the directory and database state it shows
+        self._books_message_cache: Optional[
+            tuple[tuple[Any, ...], str, InlineKeyboardMarkup]
+        ] = None
+
+        # PDF and EPUB parsing is CPU-bound, so it runs outside the event
+        # loop
+        self._book_pool = self._create_book_pool()
+
         self.ai_summarizer: Optional[AISummarizer] = None
         if config.openrouter.api_key:
             self.ai_summarizer = AISummarizer(config.openrouter)
             logger.info("AI Summarizer initialized with OpenRouter")
 
+    @staticmethod
+    def _create_book_pool() -> ProcessPoolExecutor:
+        """Create the worker pool used for book processing.
+
+        Workers are spawned rather than forked because the bot process
+        already holds threads and database connections.
+
+        Returns:
+            New process pool.
+        """
+        return ProcessPoolExecutor(
+            max_workers=BOOK_PROCESSING_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_broken_book_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Replace the book processing pool after a worker died.
+
+        A pool whose worker exits unexpectedly rejects all later work, so
+        it is swapped for a new one. Selections that failed on the same
+        broken pool only replace it once.
+
+        Args:
+            pool: The pool that raised BrokenProcessPool.
+        """
+        if self._book_pool is not pool:
+            return
+        logger.warning("Book processing pool is broken, starting a new one")
+        self._book_pool = self._create_book_pool()
+        pool.shutdown(wait=False, cancel_futures=True)
+
     def build_application(self) -> Application:  # type: ignore[type-arg]
         """Build and configure the Telegram application.
 
         Returns:
             Configured Telegram Application instance.
         """
-        self.application = Application.builder().token(self.token).build()
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .concurrent_updates(_PerChatUpdateProcessor(MAX_CONCURRENT_UPDATES))
+            .build()
+        )
         self._register_handlers()
         return self.application
 
@@ -248,8 +601,7 @@ class TelegramBotInterface:
 
         self.application.add_handler(
             MessageHandler(
-                filters.COMMAND
-                & ~filters.Regex(r"^/(start|help|books|next|pause|resume)"),
+                filters.COMMAND & _UNRECOGNIZED_COMMAND_FILTER,
                 self._handle_unrecognized_command,
             )
         )
@@ -274,31 +626,24 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.effective_user is None or update.message is None:
+        message = update.message
+        telegram_user = update.effective_user
+        if telegram_user is None or message is None:
             return
 
-        telegram_user = update.effective_user
         telegram_id = telegram_user.id
 
-        existing_user = self.user_repo.get_by_telegram_id(telegram_id)
-
-        if existing_user is None:
-            user = User(
+        self.user_repo.upsert(
+            User(
                 telegram_id=telegram_id,
                 username=telegram_user.username,
                 first_name=telegram_user.first_name,
                 last_name=telegram_user.last_name,
             )
-            self.user_repo.create(user)
-            logger.info(f"Created new user with telegram_id={telegram_id}")
-        else:
-            existing_user.username = telegram_user.username
-            existing_user.first_name = telegram_user.first_name
-            existing_user.last_name = telegram_user.last_name
-            self.user_repo.update(existing_user)
-            logger.info(f"Updated existing user with telegram_id={telegram_id}")
+        )
+        logger.info(f"Saved user profile for telegram_id={telegram_id}")
 
-        await update.message.reply_text(
+        await message.reply_text(
             WELCOME_MESSAGE,
             parse_mode="Markdown",
         )
@@ -316,10 +661,11 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.message is None:
+        message = update.message
+        if message is None:
             return
 
-        await update.message.reply_text(
+        await message.reply_text(
             HELP_MESSAGE,
             parse_mode="Markdown",
         )
@@ -338,27 +684,32 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.effective_user is None or update.message is None:
+        message = update.message
+        effective_user = update.effective_user
+        if effective_user is None or message is None:
             return
 
-        telegram_id = update.effective_user.id
+        telegram_id = effective_user.id
         user = self.user_repo.get_by_telegram_id(telegram_id)
 
         if user is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Please use /start first to create your profile.",
             )
             return
 
-        # Scan for available books in the directory
-        books_in_dir = self.book_scanner.scan()
+        # Scan for available books in the directory, remembering the list so
+        # the selection callback resolves indexes against what was shown
+        books_in_dir, dir_signature = self.book_scanner.scan_with_signature()
+        if context.user_data is not None:
+            context.user_data[_BOOK_SCAN_CACHE_KEY] = (time.monotonic(), books_in_dir)
 
         # Get books from database that have been completed
         books_in_db = self.book_repo.list_by_status(BookStatus.COMPLETED)
 
         # If neither list has books, show a message
         if not books_in_dir and not books_in_db:
-            await update.message.reply_text(
+            await message.reply_text(
                 "📚 *No Books Available*\n\n"
                 f"No books found in the configured directory.\n\n"
                 f"Directory: `{self.books_config.directory}`\n\n"
@@ -367,6 +718,42 @@ class TelegramBotInterface:
             )
             return
 
+        # The reply is the same for every user until a book is added to the
+        # directory or finishes processing, so reuse it while neither happens
+        cache_key = (
+            dir_signature,
+            tuple((book.id, book.title, book.total_snippets) for book in books_in_db),
+        )
+        cached = self._books_message_cache
+        if dir_signature is not None and cached is not None and cached[0] == cache_key:
+            _, text, reply_markup = cached
+        else:
+            text, reply_markup = self._build_books_message(books_in_dir, books_in_db)
+            self._books_message_cache = (cache_key, text, reply_markup)
+
+        await message.reply_text(
+            text,
+            parse_mode="Markdown",
+            reply_markup=reply_markup,
+        )
+
+        logger.info(
+            f"User {telegram_id} listed {len(books_in_dir)} directory books "
+            f"and {len(books_in_db)} database books"
+        )
+
+    def _build_books_message(
+        self, books_in_dir: list[BookFile], books_in_db: list[Book]
+    ) -> tuple[str, InlineKeyboardMarkup]:
+        """Build the /books message listing directory and database books.
+
+        Args:
+            books_in_dir: Book files found in the books directory.
+            books_in_db: Books that have finished processing.
+
+        Returns:
+            Tuple of the message text and its inline keyboard.
+        """
         # Build message with two sections
         message_lines = ["📚 *Book Management*\n"]
         keyboard = []
@@ -375,19 +762,22 @@ class TelegramBotInterface:
         if books_in_dir:
             message_lines.append("📂 *All Books in Directory*\n")
             message_lines.append(f"Found {len(books_in_dir)} book(s) to process:\n")
-            for idx, book in enumerate(books_in_dir, start=1):
-                size_str = self.book_scanner.format_size(book.size_bytes)
-                file_type = book.file_type.value.upper()
-                message_lines.append(
-                    f"{idx}. *{book.display_name}*\n" f"   📊 {file_type} | {size_str}"
-                )
+            message_lines.extend(
+                f"{idx}. *{book.display_name}*\n"
+                f"   📊 {book.file_type_label} | {book.size_str}"
+                for idx, book in enumerate(books_in_dir, start=1)
+            )
 
-                # Add button for processing this book
-                button_text = f"📥 {idx}. {book.display_name[:20]}"
-                callback_data = f"select_new_book:{idx}"
-                keyboard.append(
-                    [InlineKeyboardButton(button_text, callback_data=callback_data)]
-                )
+            # Add a button for processing each book
+            keyboard.extend(
+                [
+                    InlineKeyboardButton(
+                        f"📥 {idx}. {book.display_name[:20]}",
+                        callback_data=f"{_NEW_BOOK_CALLBACK_PREFIX}{idx}",
+                    )
+                ]
+                for idx, book in enumerate(books_in_dir, start=1)
+            )
 
             message_lines.append("\n")
 
@@ -395,32 +785,26 @@ class TelegramBotInterface:
         if books_in_db:
             message_lines.append("✅ *Your Books in Database*\n")
             message_lines.append(f"Found {len(books_in_db)} processed book(s):\n")
-            for idx, book in enumerate(books_in_db, start=1):
-                progress_info = f"{book.total_snippets} snippets"
-                message_lines.append(
-                    f"{idx}. *{book.title}*\n" f"   📖 {progress_info}"
-                )
+            message_lines.extend(
+                f"{idx}. *{book.title}*\n   📖 {book.total_snippets} snippets"
+                for idx, book in enumerate(books_in_db, start=1)
+            )
 
-                # Add button for selecting this book
-                button_text = f"📖 {idx}. {book.title[:20]}"
-                callback_data = f"select_existing_book:{book.id}"
-                keyboard.append(
-                    [InlineKeyboardButton(button_text, callback_data=callback_data)]
-                )
+            # Add a button for selecting each book
+            keyboard.extend(
+                [
+                    InlineKeyboardButton(
+                        f"📖 {idx}. {book.title[:20]}",
+                        callback_data=f"{_EXISTING_BOOK_CALLBACK_PREFIX}{book.id}",
+                    )
+                ]
+                for idx, book in enumerate(books_in_db, start=1)
+            )
 
         message = "\n".join(message_lines)
         reply_markup = InlineKeyboardMarkup(keyboard)
 
-        await update.message.reply_text(
-            message,
-            parse_mode="Markdown",
-            reply_markup=reply_markup,
-        )
-
-        logger.info(
-            f"User {telegram_id} listed {len(books_in_dir)} directory books "
-            f"and {len(books_in_db)} database books"
-        )
+        return message, reply_markup
 
     async def _handle_book_selection(
         self,
@@ -444,13 +828,39 @@ class TelegramBotInterface:
         callback_data = query.data or ""
 
         # Route to appropriate handler
-        if callback_data.startswith("select_new_book:"):
+        if callback_data.startswith(_NEW_BOOK_CALLBACK_PREFIX):
             await self._handle_new_book_selection(update, context)
-        elif callback_data.startswith("select_existing_book:"):
+        elif callback_data.startswith(_EXISTING_BOOK_CALLBACK_PREFIX):
             await self._handle_existing_book_selection(update, context)
         else:
             await query.edit_message_text("Invalid selection. Please try again.")
 
+    def _get_scanned_books(
+        self, context: ContextTypes.DEFAULT_TYPE
+    ) -> list[BookFile]:
+        """Get the directory books last listed to the user by /books.
+
+        Falls back to a fresh scan when there is no listing for the user
+        or it is older than BOOK_SCAN_CACHE_TTL_SECONDS.
+
+        Args:
+            context: Callback context holding the user's data.
+
+        Returns:
+            List of book files in the order they were listed.
+        """
+        cached = (
+            context.user_data.get(_BOOK_SCAN_CACHE_KEY)
+            if context.user_data is not None
+            else None
+        )
+        if cached is not None:
+            scanned_at, books = cached
+            if time.monotonic() - scanned_at < BOOK_SCAN_CACHE_TTL_SECONDS:
+                return books
+
+        return self.book_scanner.scan()
+
     async def _handle_new_book_selection(
         self,
         update: Update,
@@ -479,21 +889,20 @@ class TelegramBotInterface:
 
         # Extract index from callback data
         callback_data = query.data or ""
-        if not callback_data.startswith("select_new_book:"):
+        if not callback_data.startswith(_NEW_BOOK_CALLBACK_PREFIX):
             await query.edit_message_text("Invalid selection. Please try again.")
             return
 
         try:
             # We communicate via index to keep callback_data short
-            idx = int(callback_data.replace("select_new_book:", ""))
+            idx = int(callback_data[len(_NEW_BOOK_CALLBACK_PREFIX) :])
         except ValueError:
             await query.edit_message_text(
                 "Invalid book selection format. Please try /books again."
             )
             return
 
-        # Re-scan to resolve index to file
-        books = self.book_scanner.scan()
+        books = self._get_scanned_books(context)
         if idx < 1 or idx > len(books):
             await query.edit_message_text(
                 "Book selection out of range. The book list may have changed.\n"
@@ -513,107 +922,114 @@ class TelegramBotInterface:
         )
 
         try:
-            # Check if book already exists in database
-            existing_book = self.book_repo.get_by_file_path(str(book_file.path))
-            book = None
-            should_process = False
-
-            if existing_book is not None:
-                if (
-                    existing_book.status == BookStatus.COMPLETED
-                    and existing_book.total_snippets > 0
-                ):
-                    # Book already processed and valid
-                    book = existing_book
-                    logger.info(
-                        f"Book '{book.title}' already exists (ID: {book.id}), "
-                        f"linking to user {telegram_id}"
-                    )
+            book_file_lock = self._book_file_locks.setdefault(
+                str(book_file.path), asyncio.Lock()
+            )
+            async with book_file_lock:
+                # Check if book already exists in database
+                existing_book = self.book_repo.get_by_file_path(str(book_file.path))
+                book = None
+                should_process = False
+
+                if existing_book is not None:
+                    if (
+                        existing_book.status == BookStatus.COMPLETED
+                        and existing_book.total_snippets > 0
+                    ):
+                        # Book already processed and valid
+                        book = existing_book
+                        logger.info(
+                            f"Book '{book.title}' already exists (ID: {book.id}), "
+                            f"linking to user {telegram_id}"
+                        )
+                    else:
+                        # Book exists but is incomplete or failed, reprocess it
+                        book = existing_book
+                        should_process = True
+                        logger.info(
+                            f"Reprocessing existing book '{book.title}' "
+                            f"(ID: {book.id}) "
+                            f"Status: {book.status}, Snippets: {book.total_snippets}"
+                        )
                 else:
-                    # Book exists but is incomplete or failed, reprocess it
-                    book = existing_book
-                    should_process = True
-                    logger.info(
-                        f"Reprocessing existing book '{book.title}' (ID: {book.id}) "
-                        f"Status: {book.status}, Snippets: {book.total_snippets}"
+                    # Create new book entry
+                    book = Book(
+                        title=book_file.display_name,
+                        file_path=str(book_file.path),
+                        file_type=book_file.file_type,
+                        status=BookStatus.PROCESSING,
                     )
-            else:
-                # Create new book entry
-                book = Book(
-                    title=book_file.display_name,
-                    file_path=str(book_file.path),
-                    file_type=book_file.file_type,
-                    status=BookStatus.PROCESSING,
-                )
-                book = self.book_repo.create(book)
-                should_process = True
-                logger.info(f"Created book entry: {book.title} (ID: {book.id})")
-
-            if should_process:
-                # Update status to processing
-                if book.status != BookStatus.PROCESSING:
-                    book.status = BookStatus.PROCESSING
+                    book = self.book_repo.create(book)
+                    should_process = True
+                    logger.info(f"Created book entry: {book.title} (ID: {book.id})")
+
+                if should_process:
+                    # New books are created as processing; existing ones are set
+                    # to processing and cleared of old snippets in one write
+                    if existing_book:
+                        deleted_count = self.book_repo.reset_for_processing(book)
+                        logger.info(
+                            f"Deleted {deleted_count} old snippets for book {book.id}"
+                        )
+
+                    # Process the book and generate snippets in a worker process
+                    # so other chats are served meanwhile
+                    loop = asyncio.get_running_loop()
+                    pool = self._book_pool
+                    try:
+                        result, snippets = await loop.run_in_executor(
+                            pool, _extract_snippets, book
+                        )
+                    except Exception as e:
+                        # Leave the book retryable instead of stuck processing
+                        book.status = BookStatus.FAILED
+                        self.book_repo.update(book)
+                        if isinstance(e, BrokenProcessPool):
+                            self._replace_broken_book_pool(pool)
+                        raise
+
+                    if not result.success:
+                        book.status = BookStatus.FAILED
+                        self.book_repo.update(book)
+                        await query.edit_message_text(
+                            f"\u274c *Processing Failed*\n\n"
+                            f"{result.get_user_message()}",
+                            parse_mode="Markdown",
+                        )
+                        return
+
+                    # Save snippets to database in a single transaction
+                    self.snippet_repo.create_bulk(snippets)
+
+                    # Update book status
+                    book.total_snippets = len(snippets)
+                    book.status = BookStatus.COMPLETED
                     self.book_repo.update(book)
 
-                # Clear any existing snippets if we are reprocessing
-                if existing_book:
-                    deleted_count = self.snippet_repo.delete_by_book(book.id)  # type: ignore
                     logger.info(
-                        f"Deleted {deleted_count} old snippets for book {book.id}"
-                    )
-
-                # Process the book
-                processor = BookProcessor(book)
-                result = processor.process_book_safely()
-
-                if not result.success or result.text is None:
-                    book.status = BookStatus.FAILED
-                    self.book_repo.update(book)
-                    await query.edit_message_text(
-                        f"\u274c *Processing Failed*\n\n"
-                        f"{result.get_user_message()}",
-                        parse_mode="Markdown",
+                        f"Successfully processed book '{book.title}' "
+                        f"with {len(snippets)} snippets"
                     )
-                    return
-
-                # Generate snippets
-                generator = SnippetGenerator(book)
-                snippets = generator.generate_snippets(result.text)
-
-                # Save snippets to database
-                for snippet in snippets:
-                    self.snippet_repo.create(snippet)
-
-                # Update book status
-                book.total_snippets = len(snippets)
-                book.status = BookStatus.COMPLETED
-                self.book_repo.update(book)
 
+            # Check if user has active progress on a different book
+            active_progress = self.progress_repo.get_active(user.id)
+            if active_progress is not None and active_progress.book_id != book.id:
+                # Mark old book progress as inactive/paused
+                # For now, we just start fresh with the new book
                 logger.info(
-                    f"Successfully processed book '{book.title}' "
-                    f"with {len(snippets)} snippets"
+                    f"User {telegram_id} switching from book "
+                    f"{active_progress.book_id} to book {book.id}"
                 )
 
-            # Check if user has active progress on a different book
-            progress_list = self.progress_repo.list_by_user(user.id)
-            for progress in progress_list:
-                if not progress.is_completed and progress.book_id != book.id:
-                    # Mark old book progress as inactive/paused
-                    # For now, we just start fresh with the new book
-                    logger.info(
-                        f"User {telegram_id} switching from book {progress.book_id} "
-                        f"to book {book.id}"
-                    )
-
             # Initialize or reset user progress for this book
             existing_progress = self.progress_repo.get_by_user_and_book(
                 user.id, book.id or 0
             )
 
             if existing_progress is not None:
-                # Resume progress - update will refresh the updated_at timestamp
-                # making this the active book
-                self.progress_repo.update(existing_progress)
+                # Resume progress - refreshing updated_at makes this the
+                # active book
+                self.progress_repo.touch(existing_progress.id or 0)
                 progress = existing_progress
                 logger.info(
                     f"Resumed progress for user {telegram_id} on book '{book.title}' at position {progress.current_position}"
@@ -673,12 +1089,12 @@ class TelegramBotInterface:
 
         # Extract book ID from callback data
         callback_data = query.data or ""
-        if not callback_data.startswith("select_existing_book:"):
+        if not callback_data.startswith(_EXISTING_BOOK_CALLBACK_PREFIX):
             await query.edit_message_text("Invalid selection. Please try again.")
             return
 
         try:
-            book_id = int(callback_data.replace("select_existing_book:", ""))
+            book_id = int(callback_data[len(_EXISTING_BOOK_CALLBACK_PREFIX) :])
         except ValueError:
             await query.edit_message_text(
                 "Invalid book selection format. Please try /books again."
@@ -696,13 +1112,12 @@ class TelegramBotInterface:
 
         try:
             # Check if user has active progress on a different book
-            progress_list = self.progress_repo.list_by_user(user.id)
-            for progress in progress_list:
-                if not progress.is_completed and progress.book_id != book.id:
-                    logger.info(
-                        f"User {telegram_id} switching from book {progress.book_id} "
-                        f"to book {book.id}"
-                    )
+            active_progress = self.progress_repo.get_active(user.id)
+            if active_progress is not None and active_progress.book_id != book.id:
+                logger.info(
+                    f"User {telegram_id} switching from book "
+                    f"{active_progress.book_id} to book {book.id}"
+                )
 
             # Initialize or reset user progress for this book
             existing_progress = self.progress_repo.get_by_user_and_book(
@@ -710,9 +1125,9 @@ class TelegramBotInterface:
             )
 
             if existing_progress is not None:
-                # Resume existing progress - update will refresh the updated_at timestamp
-                # making this the active book
-                self.progress_repo.update(existing_progress)
+                # Resume progress - refreshing updated_at makes this the
+                # active book
+                self.progress_repo.touch(existing_progress.id or 0)
                 progress = existing_progress
                 logger.info(
                     f"Resumed progress for user {telegram_id} on book '{book.title}' at position {progress.current_position}"
@@ -783,6 +1198,22 @@ class TelegramBotInterface:
                 except Exception as retry_error:
                     logger.error(f"Failed to send error message: {retry_error}")
 
+    def _get_total_snippets(self, book: Book) -> int:
+        """Get the number of snippets in a book.
+
+        Completed books store their snippet count, which is set when the
+        snippets are saved, so only books still being processed are counted.
+
+        Args:
+            book: Book to count snippets for.
+
+        Returns:
+            Number of snippets in the book.
+        """
+        if book.status == BookStatus.COMPLETED and book.total_snippets:
+            return book.total_snippets
+        return self.snippet_repo.count_by_book(book.id or 0)
+
     async def _handle_next_impl(
         self,
         update: Update,
@@ -794,33 +1225,30 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.effective_user is None or update.message is None:
+        message = update.message
+        effective_user = update.effective_user
+        if effective_user is None or message is None:
             return
 
-        telegram_id = update.effective_user.id
+        telegram_id = effective_user.id
         user = self.user_repo.get_by_telegram_id(telegram_id)
 
         if user is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Please use /start first to create your profile.",
             )
             return
 
         if user.id is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "An error occurred. Please try /start again.",
             )
             return
 
-        progress_list = self.progress_repo.list_by_user(user.id)
-        active_progress = None
-        for progress in progress_list:
-            if not progress.is_completed:
-                active_progress = progress
-                break
+        active_progress = self.progress_repo.get_active(user.id)
 
         if active_progress is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "📚 You don't have any active books.\n\n"
                 "Upload a PDF or EPUB to get started!",
             )
@@ -828,18 +1256,22 @@ class TelegramBotInterface:
 
         book = self.book_repo.get_by_id(active_progress.book_id)
         if book is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "An error occurred finding your book. Please try again.",
             )
             return
 
-        total_snippets = self.snippet_repo.count_by_book(book.id or 0)
         next_position = active_progress.current_position
+        # Sent after the snippet or summary, while the new position is saved
+        closing_messages: list[str] = []
 
         if self.ai_summarizer:
+            total_snippets = self._get_total_snippets(book)
             # AI Summarization Mode
             target_count = self.config.openrouter.summary_page_count
-            end_position = next_position + target_count - 1
+            # Clamp to the last snippet, as the preprocessor does for the
+            # final range, so the lookup below can find that summary too
+            end_position = min(next_position + target_count - 1, total_snippets - 1)
 
             # Check for pre-generated summary first
             existing_summary = self.summary_repo.get_by_position(
@@ -869,7 +1301,7 @@ class TelegramBotInterface:
 
                 if not snippets:
                     title_safe = sanitize_text_for_telegram(book.title)
-                    await update.message.reply_text(
+                    await message.reply_text(
                         f"📚 *{title_safe}*\n\n"
                         "No more snippets available. You've reached the end!",
                         parse_mode="Markdown",
@@ -889,23 +1321,21 @@ class TelegramBotInterface:
                 end_page = snippets[-1].position + 1
                 title_safe = sanitize_text_for_telegram(book.title)
                 status_msg = f"🤖 *{title_safe}* Generating summary for pages {start_page}-{end_page}..."
-                try:
-                    await update.message.reply_text(
-                        status_msg,
-                        parse_mode="Markdown",
-                    )
-                except BadRequest as e:
-                    logger.warning(
-                        f"Failed to send status with Markdown: {e}. Retrying without formatting."
-                    )
-                    await update.message.reply_text(
-                        status_msg,
-                        parse_mode=None,
-                    )
 
-                summary = await self.ai_summarizer.summarize_snippets(
-                    [s.content for s in snippets], previous_snippet
+                # The status message and the summary request are independent,
+                # so send one while waiting on the other
+                summary_task = asyncio.create_task(
+                    self.ai_summarizer.summarize_snippets(
+                        [s.content for s in snippets], previous_snippet
+                    )
                 )
+                try:
+                    await _reply_markdown_or_plain(message, status_msg, "status")
+                except BaseException:
+                    # Nothing would read the summary, so stop the paid request
+                    summary_task.cancel()
+                    raise
+                summary = await summary_task
                 snippets_count = len(snippets)
 
             # Clean and format the summary specifically for Telegram HTML
@@ -913,7 +1343,7 @@ class TelegramBotInterface:
             safe_summary = sanitize_text_for_telegram(formatted_summary)
 
             try:
-                await update.message.reply_text(
+                await message.reply_text(
                     safe_summary,
                     parse_mode="HTML",
                 )
@@ -923,7 +1353,7 @@ class TelegramBotInterface:
                 )
                 # Fallback: Strip all tags for clean plain text
                 plain_text = BeautifulSoup(summary, "html.parser").get_text()
-                await update.message.reply_text(
+                await message.reply_text(
                     sanitize_text_for_telegram(plain_text),
                     parse_mode=None,
                 )
@@ -933,22 +1363,35 @@ class TelegramBotInterface:
             active_progress.current_position = new_position
 
             # Show progress
-            progress_pct = (new_position / total_snippets) * 100
-            await update.message.reply_text(
+            progress_pct = new_position * 100 / total_snippets
+            closing_messages.append(
                 f"📖 *Progress*: {new_position}/{total_snippets} ({progress_pct:.1f}%)\n\n"
-                "Tap /next to continue reading.",
-                parse_mode="Markdown",
+                "Tap /next to continue reading."
             )
 
         else:
             # Standard Mode (Single Snippet)
-            snippet = self.snippet_repo.get_by_book_and_position(
-                active_progress.book_id, next_position
-            )
+            if book.status == BookStatus.COMPLETED and book.total_snippets:
+                total_snippets = book.total_snippets
+                snippet = self.snippet_repo.get_by_book_and_position(
+                    active_progress.book_id, next_position
+                )
+            else:
+                # The count and the snippet lookup are independent, so run
+                # them on executor threads, each of which has its own
+                # connection
+                total_snippets, snippet = await asyncio.gather(
+                    asyncio.to_thread(self.snippet_repo.count_by_book, book.id or 0),
+                    asyncio.to_thread(
+                        self.snippet_repo.get_by_book_and_position,
+                        active_progress.book_id,
+                        next_position,
+                    ),
+                )
 
             if snippet is None:
                 title_safe = sanitize_text_for_telegram(book.title)
-                await update.message.reply_text(
+                await message.reply_text(
                     f"📚 *{title_safe}*\n\n"
                     "No more snippets available. You've reached the end!",
                     parse_mode="Markdown",
@@ -958,36 +1401,36 @@ class TelegramBotInterface:
             formatter = SnippetFormatter(book, total_snippets=total_snippets)
             formatted = formatter.format_snippet(snippet, active_progress)
 
-            for message in formatted.messages:
-                try:
-                    await update.message.reply_text(
-                        message.text,
-                        parse_mode="Markdown",
-                    )
-                except BadRequest as e:
-                    logger.warning(
-                        f"Failed to send snippet with Markdown: {e}. Retrying without formatting."
-                    )
-                    await update.message.reply_text(
-                        message.text,
-                        parse_mode=None,
-                    )
+            # Parts of a long snippet are sent one after another, since
+            # Telegram only keeps the order of requests that do not overlap
+            for part in formatted.messages:
+                await _reply_markdown_or_plain(message, part.text, "snippet")
 
             active_progress.current_position = next_position + 1
 
         if active_progress.current_position >= total_snippets:
             active_progress.is_completed = True
-            active_progress.completed_at = datetime.utcnow()
+            active_progress.completed_at = datetime.now(ZoneInfo("UTC")).replace(
+                tzinfo=None
+            )
             title_safe = sanitize_text_for_telegram(book.title)
-            await update.message.reply_text(
+            closing_messages.append(
                 f"🎉 *Congratulations!*\n\n"
                 f"You've completed *{title_safe}*!\n\n"
                 f"📚 Total snippets read: {total_snippets}\n\n"
-                f"Great job on finishing this book! 🏆",
-                parse_mode="Markdown",
+                f"Great job on finishing this book! 🏆"
             )
 
-        self.progress_repo.update(active_progress)
+        async def send_closing_messages() -> None:
+            for text in closing_messages:
+                await message.reply_text(text, parse_mode="Markdown")
+
+        # The progress write does not depend on the replies, so save it on
+        # an executor thread while they are sent
+        await asyncio.gather(
+            asyncio.to_thread(self.progress_repo.update, active_progress),
+            send_closing_messages(),
+        )
 
         if active_progress.current_position >= total_snippets:
             logger.info(
@@ -1013,20 +1456,22 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.effective_user is None or update.message is None:
+        message = update.message
+        effective_user = update.effective_user
+        if effective_user is None or message is None:
             return
 
-        telegram_id = update.effective_user.id
+        telegram_id = effective_user.id
         user = self.user_repo.get_by_telegram_id(telegram_id)
 
         if user is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Please use /start first to create your profile.",
             )
             return
 
         if user.id is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "An error occurred. Please try /start again.",
             )
             return
@@ -1036,21 +1481,21 @@ class TelegramBotInterface:
         if paused_count == 0:
             schedules = self.schedule_repo.list_by_user(user.id)
             if not schedules:
-                await update.message.reply_text(
+                await message.reply_text(
                     "⏸️ *No Schedules to Pause*\n\n"
                     "You don't have any delivery schedules set up yet.\n"
                     "Upload a book and set a schedule to get started!",
                     parse_mode="Markdown",
                 )
             else:
-                await update.message.reply_text(
+                await message.reply_text(
                     "⏸️ *Already Paused*\n\n"
                     "All your delivery schedules are already paused.\n"
                     "Use /resume to restart automatic deliveries.",
                     parse_mode="Markdown",
                 )
         else:
-            await update.message.reply_text(
+            await message.reply_text(
                 f"⏸️ *Deliveries Paused*\n\n"
                 f"Paused {paused_count} delivery schedule(s).\n\n"
                 "You can still use /next to get snippets manually.\n"
@@ -1072,20 +1517,22 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.effective_user is None or update.message is None:
+        message = update.message
+        effective_user = update.effective_user
+        if effective_user is None or message is None:
             return
 
-        telegram_id = update.effective_user.id
+        telegram_id = effective_user.id
         user = self.user_repo.get_by_telegram_id(telegram_id)
 
         if user is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Please use /start first to create your profile.",
             )
             return
 
         if user.id is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "An error occurred. Please try /start again.",
             )
             return
@@ -1095,21 +1542,21 @@ class TelegramBotInterface:
         if resumed_count == 0:
             schedules = self.schedule_repo.list_by_user(user.id)
             if not schedules:
-                await update.message.reply_text(
+                await message.reply_text(
                     "▶️ *No Schedules to Resume*\n\n"
                     "You don't have any delivery schedules set up yet.\n"
                     "Upload a book and set a schedule to get started!",
                     parse_mode="Markdown",
                 )
             else:
-                await update.message.reply_text(
+                await message.reply_text(
                     "▶️ *Already Active*\n\n"
                     "All your delivery schedules are already active.\n"
                     "Use /pause to stop automatic deliveries.",
                     parse_mode="Markdown",
                 )
         else:
-            await update.message.reply_text(
+            await message.reply_text(
                 f"▶️ *Deliveries Resumed*\n\n"
                 f"Resumed {resumed_count} delivery schedule(s).\n\n"
                 "You will start receiving snippets at your scheduled times.\n"
@@ -1129,22 +1576,25 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.message is None or update.message.from_user is None:
+        message = update.message
+        if message is None or message.from_user is None:
             return
 
-        telegram_id = update.message.from_user.id
+        telegram_id = message.from_user.id
         user = self.user_repo.get_by_telegram_id(telegram_id)
 
         if user is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Please use /start first to create your profile.",
             )
             return
 
-        # Check if user has selected a book
-        progress_records = self.progress_repo.list_by_user(user.id)
-        if not progress_records:
-            await update.message.reply_text(
+        # Get the active book (most recent non-completed)
+        active_progress = self.progress_repo.get_active(user.id)
+
+        # Check if user has selected a book at all
+        if active_progress is None and not self.progress_repo.list_by_user(user.id):
+            await message.reply_text(
                 "⚠️ *No Book Selected*\n\n"
                 "You need to select a book first before setting up a schedule.\n\n"
                 "Use /books to select a book!",
@@ -1152,15 +1602,8 @@ class TelegramBotInterface:
             )
             return
 
-        # Get the active book (most recent non-completed)
-        active_progress = None
-        for progress in progress_records:
-            if not progress.is_completed:
-                active_progress = progress
-                break
-
         if active_progress is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "⚠️ *No Active Book*\n\n"
                 "You've completed all your books! Use /books to select a new one.",
                 parse_mode="Markdown",
@@ -1169,7 +1612,7 @@ class TelegramBotInterface:
 
         book = self.book_repo.get_by_id(active_progress.book_id)
         if book is None:
-            await update.message.reply_text(
+            await message.reply_text(
                 "Error: Book not found. Please select a book again using /books.",
             )
             return
@@ -1190,14 +1633,14 @@ class TelegramBotInterface:
                     book.author,
                 )
                 if schedule_info:
-                    await update.message.reply_text(
+                    await message.reply_text(
                         f"📅 *Current Schedule*\n\n{schedule_info.format_for_display()}",
                         parse_mode="Markdown",
                     )
                     return
 
             # Show usage help
-            await update.message.reply_text(
+            await message.reply_text(
                 "⏰ *Set Delivery Schedule*\n\n"
                 "*Usage:* `/schedule TIME [FREQUENCY] [TIMEZONE]`\n\n"
                 "*Examples:*\n"
@@ -1219,7 +1662,7 @@ class TelegramBotInterface:
         # Parse time (required)
         time_str = args[0]
         if ":" not in time_str or len(time_str.split(":")) != 2:
-            await update.message.reply_text(
+            await message.reply_text(
                 "❌ *Invalid Time Format*\n\n"
                 "Please use HH:MM format (e.g., 09:00 or 14:30)\n\n"
                 "Example: `/schedule 09:00`",
@@ -1232,7 +1675,7 @@ class TelegramBotInterface:
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 raise ValueError("Invalid time")
         except ValueError:
-            await update.message.reply_text(
+            await message.reply_text(
                 "❌ *Invalid Time*\n\n"
                 "Hours must be 0-23 and minutes must be 0-59.\n\n"
                 "Example: `/schedule 09:00`",
@@ -1253,7 +1696,7 @@ class TelegramBotInterface:
             elif freq_str in ["weekly", "week", "w"]:
                 frequency = Frequency.WEEKLY
             else:
-                await update.message.reply_text(
+                await message.reply_text(
                     "❌ *Invalid Frequency*\n\n"
                     "Valid options: `daily`, `twice_daily`, `weekly`\n\n"
                     "Example: `/schedule 09:00 daily`",
@@ -1270,7 +1713,7 @@ class TelegramBotInterface:
 
                 ZoneInfo(timezone)  # Validate timezone
             except Exception:
-                await update.message.reply_text(
+                await message.reply_text(
                     f"❌ *Invalid Timezone*\n\n"
                     f"'{timezone}' is not a valid timezone.\n\n"
                     "Examples: `America/New_York`, `Europe/London`, `Asia/Tokyo`\n\n"
@@ -1297,7 +1740,7 @@ class TelegramBotInterface:
 
             effective_tz = timezone or user.timezone
 
-            await update.message.reply_text(
+            await message.reply_text(
                 f"✅ *Schedule Set!*\n\n"
                 f"📚 *Book:* {book.title}\n"
                 f"⏰ *Time:* {time_str}\n"
@@ -1315,7 +1758,7 @@ class TelegramBotInterface:
             logger.error(
                 f"Error setting schedule for user {telegram_id}: {e}", exc_info=True
             )
-            await update.message.reply_text(
+            await message.reply_text(
                 f"❌ *Error Setting Schedule*\n\n"
                 f"An error occurred: {str(e)}\n\n"
                 "Please try again or contact support.",
@@ -1335,17 +1778,15 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.message is None:
+        message = update.message
+        if message is None:
             return
 
-        text = update.message.text or ""
+        text = message.text or ""
         logger.info(f"Unrecognized command received: {text}")
 
         response = self._get_suggestion_message(text)
-        await update.message.reply_text(
-            response,
-            parse_mode="Markdown",
-        )
+        await message.reply_text(response, parse_mode="Markdown")
 
     async def _handle_text_message(
         self,
@@ -1360,16 +1801,14 @@ class TelegramBotInterface:
             update: Telegram update object.
             context: Callback context.
         """
-        if update.message is None:
+        message = update.message
+        if message is None:
             return
 
-        text = update.message.text or ""
+        text = message.text or ""
         logger.info(f"Plain text message received: {text[:50]}...")
 
-        response = """I can only respond to commands right now.
-
-Try /help to see the list of available commands!"""
-        await update.message.reply_text(response)
+        await message.reply_text(PLAIN_TEXT_MESSAGE)
 
     def _get_suggestion_message(self, user_input: str) -> str:
         """Generate a helpful suggestion message based on user input.
@@ -1380,55 +1819,26 @@ Try /help to see the list of available commands!"""
         Returns:
             A formatted message with suggestions.
         """
-        user_input_lower = user_input.lower().strip()
-
-        common_mistakes = {
-            "begin": "/start",
-            "starts": "/start",
-            "starting": "/start",
-            "hi": "/start",
-            "hello": "/start",
-            "hey": "/start",
-            "helps": "/help",
-            "helping": "/help",
-            "?": "/help",
-            "commands": "/help",
-            "menu": "/help",
-            "nexts": "/next",
-            "continue": "/next",
-            "more": "/next",
-            "read": "/next",
-            "snippet": "/next",
-            "stop": "/pause",
-            "paused": "/pause",
-            "halt": "/pause",
-            "unpause": "/resume",
-            "restart": "/resume",
-            "resumed": "/resume",
-        }
-
-        for key, suggestion in common_mistakes.items():
-            if key in user_input_lower:
-                return f"""❓ *Did you mean {suggestion}?*
-
-Your message: `{user_input}`
-
-Try using *{suggestion}* instead.
-
-Use /help to see all available commands."""
+        suggestion = _suggest_command(user_input)
+        if suggestion is not None:
+            return SUGGESTION_MESSAGE_TEMPLATE.format(
+                suggestion=suggestion, user_input=user_input
+            )
 
         return UNRECOGNIZED_COMMAND_MESSAGE
 
     async def run_polling(self) -> None:
         """Start the bot in polling mode."""
-        if self.application is None:
-            self.build_application()
+        application = self.application or self.build_application()
+
+        logger.info("Starting bot polling...")
+        await application.initialize()
+        await application.start()
+        await application.updater.start_polling()  # type: ignore[union-attr]
 
-        if self.application is not None:
-            logger.info("Starting bot polling...")
-            await self.application.initialize()
-            await self.application.start()
-            await self.application.updater.start_polling()  # type: ignore[union-attr]
+    def shutdown(self) -> None:
+        """Stop the book processing workers, abandoning queued books."""
+        self._book_pool.shutdown(wait=False, cancel_futures=True)
 
     def get_user_repo(self) -> UserRepository:
         """Get the user repository.
@@ -8,10 +8,7 @@ from typing import Optional
 
 
 from booktok.config import AppConfig, load_config, setup_logging, validate_config
-from booktok.database import (
-    close_database,
-    DatabaseConnectionError,
-)
+from booktok.database import DatabaseConnectionError
 from booktok.delivery_scheduler import AutomatedDeliveryRunner
 from booktok.repository import DatabaseConnectionManager
 from booktok.summary_preprocessor import SummaryPreprocessorRunner
@@ -89,6 +86,8 @@ class BookTokApplication:
                 db_manager=self.db_manager,
                 openrouter_config=self.config.openrouter,
                 check_interval_seconds=300,  # Check every 5 minutes
+                # Share the bot's summarizer so both reuse one connection pool
+                ai_summarizer=self.bot_interface.ai_summarizer,
             )
             logger.info("Summary preprocessor runner initialized")
         else:
@@ -144,9 +143,17 @@ class BookTokApplication:
             await self.bot_interface.application.stop()
             logger.info("Telegram bot stopped")
 
+        if self.bot_interface:
+            self.bot_interface.shutdown()
+            logger.info("Book processing workers stopped")
+
+        if self.bot_interface and self.bot_interface.ai_summarizer:
+            await self.bot_interface.ai_summarizer.close()
+            logger.info("AI summarizer connections closed")
+
         if self.db_manager:
-            close_database(self.db_manager.get_connection())
-            logger.info("Database connection closed")
+            self.db_manager.close()
+            logger.info("Database connections closed")
 
         logger.info("BookTok application stopped")
 